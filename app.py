@@ -1,6 +1,8 @@
 import streamlit as st
 import os
-from datetime import datetime
+import io
+import csv
+import pandas as pd
 from utils.auth import (
     get_current_user_role, 
     get_current_user_email,
@@ -9,10 +11,15 @@ from utils.auth import (
     show_admin_login
 )
 from utils.registration import (
+    get_app_cache,
     show_registration_form,
     is_current_tester_registered,
     get_current_tester_registration,
     get_registration_stats,
+    get_registration_rows,
+    get_session_registrations,
+    get_registrations_version,
+    bump_registrations_version,
     clear_current_registration
 )
 
@@ -24,14 +31,198 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Static Home page content
+_HOME_INTRO_MD = """
+## 🎯 Welcome to the Intelligent Business Analysis Research Platform
+
+This research platform provides a comprehensive framework for evaluating and comparing free-tier 
+Large Language Models (LLMs) in business intelligence applications, specifically focusing on 
+**retail and finance industries**.
+
+## 📋 Research Overview
+
+Organizations increasingly rely on AI-powered analysis for critical business decisions, yet selecting 
+the optimal LLM provider remains challenging due to limited comparative research and evidence-based 
+guidance. This study addresses this gap by providing systematic evaluation of free-tier LLMs through 
+both human assessment and automated technical metrics.
+"""
+
+_HOME_METHODOLOGY_MD = """
+### 🔬 Research Methodology
+
+**Dual Evaluation Approach:**
+- **Human Blind Evaluation**: External testers evaluate AI responses without knowing 
+  which model generated each answer
+- **Automated Technical Assessment**: Continuous monitoring of latency, throughput, 
+  and reliability metrics
+
+**Retrieval-Augmented Generation (RAG):**
+- Responses grounded in real business datasets
+- Context-driven answer generation for improved relevance
+- Industry-specific knowledge base integration
+
+**Data-Driven Insights:**
+- Real e-commerce shopping trends dataset (3,900+ records)
+- Tesla stock market analysis data (2010-2025)
+- Comprehensive business scenarios and use cases
+"""
+
+_HOME_FEATURES_MD = """
+### 🎯 Key Features
+
+**LLM Providers Evaluated:**
+- **Groq**: High-speed inference optimization
+- **OpenRouter**: Multi-model access platform
+- **Four distinct models** selected for comprehensive comparison
+
+**Evaluation Focus Areas:**
+- Response quality and clarity
+- Factual accuracy vs. ground truth
+- Business relevance and actionability
+- Consistency and organization
+
+**Target Industries:**
+- **Retail**: Customer behavior, sales analysis, inventory insights
+- **Finance**: Market trends, risk assessment, investment analysis
+"""
+
+_HOME_PARTICIPATE_MD = """
+### 🚀 Participate in the Research
+
+**For External Evaluators:**
+Your participation helps advance AI evaluation methodologies and provides organizations 
+with evidence-based guidance for LLM selection in business contexts.
+
+**Time Commitment:** 20-30 minutes  
+**Evaluation Process:** Blind comparison of AI responses to business questions  
+**Impact:** Contribute to research that guides real-world AI adoption decisions  
+"""
+
+_HOME_SIGNIFICANCE_MD = """
+## 🎓 Research Significance
+
+This study contributes to the growing field of AI evaluation by:
+
+- **Advancing Evaluation Methodologies**: Combining human judgment with automated metrics 
+  for comprehensive LLM assessment
+- **Industry-Specific Insights**: Providing targeted evaluation for business intelligence applications
+- **Open Research**: Transparent methodology and findings to benefit the broader research community
+- **Practical Applications**: Direct relevance for organizations making AI adoption decisions
+
+### 📊 Expected Outcomes
+
+- **Comparative Performance Rankings** of free-tier LLMs in business contexts
+- **Best Practice Recommendations** for LLM selection and implementation  
+- **Evaluation Framework** that can be applied to future LLM assessments
+- **Open Dataset** of business-focused LLM evaluation results
+"""
+
+_HOME_FOOTER_HTML = """
+<div style="text-align: center; color: #666; font-size: 0.9rem;">
+🎓 <strong>Academic Research Project</strong> | 
+Advancing AI Evaluation for Business Intelligence | 
+Your participation contributes to open research
+</div>
+"""
+
+# Static admin page content
+_ADMIN_LOGIN_MD = """
+Administrator access provides full system control including:
+
+- **Analysis Dashboard**: View evaluation results and performance metrics
+- **Admin Panel**: Manage system configuration and user data
+- **System Monitoring**: Access technical performance data
+- **Data Export**: Download evaluation results and reports
+"""
+
+_DASHBOARD_INTRO_MD = """
+### Analysis Tools Overview
+
+This dashboard provides access to comprehensive analysis tools for LLM evaluation:
+"""
+
+_DASHBOARD_BLIND_MD = """
+**Human Evaluation Data Analysis**
+- Statistical analysis with confidence intervals
+- Multi-dimensional LLM performance comparison
+- Rating distributions and significance testing
+- Qualitative feedback analysis
+"""
+
+_DASHBOARD_TECHNICAL_MD = """
+**Automated Performance Analysis**
+- Performance metrics over time
+- Latency, throughput, and reliability analysis
+- Failure analysis and rate limit detection
+- Industry-specific performance comparisons
+"""
+
+_ADMIN_PANEL_INTRO_MD = """
+### System Management & Configuration
+
+Administrative tools for managing the LLM evaluation system.
+"""
+
 def init_session_state():
     """Initialize session state with default values"""
     # Initialize registration storage if not set
     if "tester_registrations" not in st.session_state:
         st.session_state["tester_registrations"] = {}
     
-    # DO NOT initialize current_page here - let the navigation logic handle it
-    # This ensures user's page selection persists across refreshes
+    # Initialize app bookkeeping values
+    get_app_cache()
+
+# Sidebar navigation groups, combined per user role in display order
+_NAV_BASE = ("Home",)
+_NAV_EVALUATION = ("Blind Evaluation",)
+_NAV_ADMIN = ("Analysis Dashboard", "Admin Panel")
+_NAV_SHARED = ("RAG Demo",)
+# Direct access to analysis pages for admins
+_NAV_ADMIN_ANALYSIS = (
+    "Blind Evaluation Analysis", "Technical Metrics Analysis", "Provider Comparison Analysis",
+    "Analysis Hub", "LLM Health Check",
+)
+_NAV_LOGIN = ("Admin Login",)
+# Anonymous visitors register before they can evaluate
+_NAV_REGISTRATION = ("Tester Registration",)
+
+_NAV_BY_ROLE = {
+    None: _NAV_BASE + _NAV_REGISTRATION + _NAV_SHARED + _NAV_LOGIN,
+    "tester": _NAV_BASE + _NAV_EVALUATION + _NAV_SHARED,
+    "admin": _NAV_BASE + _NAV_EVALUATION + _NAV_ADMIN + _NAV_SHARED + _NAV_ADMIN_ANALYSIS,
+}
+
+# Landing page per user role
+_DEFAULT_PAGE_BY_ROLE = {None: "Home", "tester": "Blind Evaluation", "admin": "Analysis Dashboard"}
+
+def bind_page(page_fn, *args):
+    """Bind per-rerun arguments to a page callable so st.Page can run it without arguments"""
+    def page():
+        page_fn(*args)
+    page.__name__ = page_fn.__name__
+    return page
+
+def guarded_page(page_fn, page_name, required_role, current_role):
+    """Run a page only if the current user has the required role"""
+    if enforce_page_access(page_name, required_role, current_role):
+        page_fn()
+
+def make_page(name, current_role):
+    """Create the st.Page for a navigation entry"""
+    try:
+        target, required_role, icon, url_path = _ROUTES[name]
+    except KeyError:
+        raise ValueError(f"Unknown page: {name}")
+    if required_role is not None:
+        page_fn = target
+        target = bind_page(guarded_page, page_fn, name, required_role, current_role)
+        target.__name__ = page_fn.__name__
+    return st.Page(target, title=name, icon=icon, url_path=url_path,
+                   default=_DEFAULT_PAGE_BY_ROLE[current_role] == name)
+
+def build_navigation(current_role):
+    """Build the st.navigation page list for the current user role"""
+    return {name: make_page(name, current_role) for name in _NAV_BY_ROLE[current_role]}
 
 def main():
     """Main application entry point"""
@@ -39,167 +230,47 @@ def main():
     # Initialize session state
     init_session_state()
     
-    # Header
-    st.title("🤖 Intelligent Business Analysis Using Free-Tier LLMs")
-    st.caption("🔄 Version 2.1 - Enhanced Evaluation System")
-    st.markdown("---")
-    
-    # Sidebar navigation
-    st.sidebar.title("Navigation")
-    
-    # Get current user role for dynamic navigation
+    # Look up the current user once per rerun and pass it down
     current_role = get_current_user_role()
     
-    # Build navigation options based on user role
-    nav_options = ["Home", "RAG Demo"]
-    
-    # Add role-specific pages
-    if current_role == "tester" or current_role == "admin":
-        nav_options.insert(-1, "Blind Evaluation")
+    # st.navigation routes via the URL path and only runs the selected page,
+    # so the selection persists across refreshes without session bookkeeping
+    pages = build_navigation(current_role)
+    # The section label is drawn by the navigation widget itself
+    page = st.navigation({"Navigation": list(pages.values())}, position="sidebar")
     
-    if current_role == "admin":
-        nav_options.insert(-1, "Analysis Dashboard")
-        nav_options.insert(-1, "Admin Panel")
-        # Add direct access to analysis pages for admins
-        nav_options.extend(["Blind Evaluation Analysis", "Technical Metrics Analysis", "Provider Comparison Analysis"])
+    # Pages (e.g. the evaluation thank-you screen) request a return to Home
+    if st.session_state.pop("return_home", False):
+        st.switch_page(pages["Home"])
+    # The Home call to action opens the evaluation, or registration first
+    if st.session_state.pop("start_evaluation", False):
+        st.switch_page(pages.get("Blind Evaluation") or pages["Tester Registration"])
     
-    # If not authenticated, show admin login option only
-    if not current_role:
-        nav_options.append("Admin Login")
+    # Header, shared by every page
+    st.title("🤖 Intelligent Business Analysis Using Free-Tier LLMs")
+    st.caption("🔄 Version 2.1 - Enhanced Evaluation System")
+    st.markdown("---")
     
-    # Determine default page based on user role and session state
-    current_page_in_session = st.session_state.get("current_page")
+    # Show logout button if authenticated; anonymous visitors skip the user lookups
+    if current_role is not None:
+        show_logout_button(current_role, get_current_user_email())
     
-    if current_role == "tester":
-        # For testers, ensure they're not on login pages or invalid pages
-        if (not current_page_in_session or 
-            current_page_in_session in ["Admin Login"] or 
-            current_page_in_session not in nav_options):
-            default_page = "Blind Evaluation"
-        else:
-            default_page = current_page_in_session
-    elif current_role == "admin":
-        # For admins, ensure they're not on login pages or invalid pages  
-        if (not current_page_in_session or 
-            current_page_in_session in ["Admin Login"] or 
-            current_page_in_session not in nav_options):
-            default_page = "Analysis Dashboard"
-        else:
-            default_page = current_page_in_session
-    else:
-        # For unauthenticated users - default to Blind Evaluation for easier access
-        if not current_page_in_session or current_page_in_session not in nav_options:
-            default_page = "Blind Evaluation"  # Changed from nav_options[0] to "Blind Evaluation"
-        else:
-            default_page = current_page_in_session
-    
-    # Ensure the default page is in available options
-    if default_page not in nav_options:
-        default_page = nav_options[0]
-    
-    page = st.sidebar.selectbox("Select Page", nav_options, index=nav_options.index(default_page))
-    
-    # Store the current page selection in session state
-    st.session_state["current_page"] = page
-    
-    # Show logout button if authenticated
-    show_logout_button()
-    
-    # Route to appropriate page with access control
-    if page == "Home":
-        show_home()
-    elif page == "Admin Login":
-        show_admin_login_page()
-    elif page == "Blind Evaluation":
-        if enforce_page_access("Blind Evaluation", "tester"):
-            # Redirect directly to the blind evaluation Streamlit page
-            st.switch_page("pages/blind_evaluation.py")
-    elif page == "Analysis Dashboard":
-        if enforce_page_access("Analysis Dashboard", "admin"):
-            show_analysis_dashboard()
-    elif page == "Admin Panel":
-        if enforce_page_access("Admin Panel", "admin"):
-            show_admin_panel()
-    elif page == "Blind Evaluation Analysis":
-        if enforce_page_access("Blind Evaluation Analysis", "admin"):
-            st.switch_page("pages/blind_evaluation_analysis.py")
-    elif page == "Technical Metrics Analysis":
-        if enforce_page_access("Technical Metrics Analysis", "admin"):
-            st.switch_page("pages/technical_metrics_analysis.py")
-    elif page == "Provider Comparison Analysis":
-        if enforce_page_access("Provider Comparison Analysis", "admin"):
-            st.switch_page("pages/provider_comparison.py")
-    elif page == "RAG Demo":
-        st.switch_page("pages/rag_demo.py")
-    else:
-        st.info(f"📋 {page} - Under Development")
-        st.markdown("This page will be implemented in upcoming releases.")
+    page.run()
 
 def show_home():
     """Display the home page with comprehensive project information"""
     
-    # Project introduction
-    st.markdown("""
-    ## 🎯 Welcome to the Intelligent Business Analysis Research Platform
-    
-    This research platform provides a comprehensive framework for evaluating and comparing free-tier 
-    Large Language Models (LLMs) in business intelligence applications, specifically focusing on 
-    **retail and finance industries**.
-    """)
-    
-    # Main project description
-    st.markdown("""
-    ## 📋 Research Overview
-    
-    Organizations increasingly rely on AI-powered analysis for critical business decisions, yet selecting 
-    the optimal LLM provider remains challenging due to limited comparative research and evidence-based 
-    guidance. This study addresses this gap by providing systematic evaluation of free-tier LLMs through 
-    both human assessment and automated technical metrics.
-    """)
+    # Project introduction and research overview
+    st.markdown(_HOME_INTRO_MD)
     
     # Two-column layout for key information
     col1, col2 = st.columns([1, 1], gap="large")
     
     with col1:
-        st.markdown("""
-        ### 🔬 Research Methodology
-        
-        **Dual Evaluation Approach:**
-        - **Human Blind Evaluation**: External testers evaluate AI responses without knowing 
-          which model generated each answer
-        - **Automated Technical Assessment**: Continuous monitoring of latency, throughput, 
-          and reliability metrics
-        
-        **Retrieval-Augmented Generation (RAG):**
-        - Responses grounded in real business datasets
-        - Context-driven answer generation for improved relevance
-        - Industry-specific knowledge base integration
-        
-        **Data-Driven Insights:**
-        - Real e-commerce shopping trends dataset (3,900+ records)
-        - Tesla stock market analysis data (2010-2025)
-        - Comprehensive business scenarios and use cases
-        """)
+        st.markdown(_HOME_METHODOLOGY_MD)
     
     with col2:
-        st.markdown("""
-        ### 🎯 Key Features
-        
-        **LLM Providers Evaluated:**
-        - **Groq**: High-speed inference optimization
-        - **OpenRouter**: Multi-model access platform
-        - **Four distinct models** selected for comprehensive comparison
-        
-        **Evaluation Focus Areas:**
-        - Response quality and clarity
-        - Factual accuracy vs. ground truth
-        - Business relevance and actionability
-        - Consistency and organization
-        
-        **Target Industries:**
-        - **Retail**: Customer behavior, sales analysis, inventory insights
-        - **Finance**: Market trends, risk assessment, investment analysis
-        """)
+        st.markdown(_HOME_FEATURES_MD)
     
     # Call to action section
     st.markdown("---")
@@ -207,117 +278,76 @@ def show_home():
     cta_col1, cta_col2, cta_col3 = st.columns([1, 2, 1])
     
     with cta_col2:
-        st.markdown("""
-        ### 🚀 Participate in the Research
-        
-        **For External Evaluators:**
-        Your participation helps advance AI evaluation methodologies and provides organizations 
-        with evidence-based guidance for LLM selection in business contexts.
-        
-        **Time Commitment:** 20-30 minutes  
-        **Evaluation Process:** Blind comparison of AI responses to business questions  
-        **Impact:** Contribute to research that guides real-world AI adoption decisions  
-        """)
+        st.markdown(_HOME_PARTICIPATE_MD)
         
         if st.button("🔍 Start Blind Evaluation", type="primary", use_container_width=True):
-            st.session_state["current_page"] = "Blind Evaluation"
-            st.switch_page("pages/blind_evaluation.py")
+            st.session_state["start_evaluation"] = True
+            st.rerun()
     
     # Research significance
     st.markdown("---")
-    st.markdown("""
-    ## 🎓 Research Significance
-    
-    This study contributes to the growing field of AI evaluation by:
-    
-    - **Advancing Evaluation Methodologies**: Combining human judgment with automated metrics 
-      for comprehensive LLM assessment
-    - **Industry-Specific Insights**: Providing targeted evaluation for business intelligence applications
-    - **Open Research**: Transparent methodology and findings to benefit the broader research community
-    - **Practical Applications**: Direct relevance for organizations making AI adoption decisions
-    
-    ### 📊 Expected Outcomes
-    
-    - **Comparative Performance Rankings** of free-tier LLMs in business contexts
-    - **Best Practice Recommendations** for LLM selection and implementation  
-    - **Evaluation Framework** that can be applied to future LLM assessments
-    - **Open Dataset** of business-focused LLM evaluation results
-    """)
+    st.markdown(_HOME_SIGNIFICANCE_MD)
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; font-size: 0.9rem;">
-    🎓 <strong>Academic Research Project</strong> | 
-    Advancing AI Evaluation for Business Intelligence | 
-    Your participation contributes to open research
-    </div>
-    """, unsafe_allow_html=True)
-
-
+    st.markdown(_HOME_FOOTER_HTML, unsafe_allow_html=True)
 
 def show_admin_login_page():
     """Display admin login page"""
     st.header("🔐 Administrator Authentication")
-    st.markdown("""
-    Administrator access provides full system control including:
-    
-    - **Analysis Dashboard**: View evaluation results and performance metrics
-    - **Admin Panel**: Manage system configuration and user data
-    - **System Monitoring**: Access technical performance data
-    - **Data Export**: Download evaluation results and reports
-    """)
+    st.markdown(_ADMIN_LOGIN_MD)
     
     st.markdown("---")
     show_admin_login()
 
-def show_blind_evaluation():
-    """Display the blind evaluation page for testers"""
-    
-    # Import and run the blind evaluation page directly
+@st.cache_resource(show_spinner=False)
+def load_blind_evaluation_module():
+    """Import the blind evaluation page module once per process"""
     try:
-        from pages.blind_evaluation import show_evaluation_interface
-        show_evaluation_interface()
+        import pages.blind_evaluation as blind_evaluation
+        return blind_evaluation
     except ImportError:
+        return None
+
+def show_blind_evaluation_view(view_name):
+    """Run one of the blind evaluation page's views"""
+    blind_evaluation = load_blind_evaluation_module()
+    if blind_evaluation is None:
         st.error("❌ Blind evaluation interface not available. Please contact the administrator.")
+        return
+    
+    try:
+        getattr(blind_evaluation, view_name)()
     except Exception as e:
         st.error(f"❌ Error loading evaluation interface: {str(e)}")
         st.error(f"Debug: {type(e).__name__}: {str(e)}")
 
+def show_blind_evaluation():
+    """Display the blind evaluation page for testers"""
+    show_blind_evaluation_view("show_evaluation_interface")
+
+def show_tester_registration():
+    """Display tester registration for visitors who are not signed in yet"""
+    show_blind_evaluation_view("show_registration_form")
+
 def show_analysis_dashboard():
     """Display the analysis dashboard for administrators"""
     st.header("📊 Analysis Dashboard")
     
-    st.markdown("""
-    ### Analysis Tools Overview
-    
-    This dashboard provides access to comprehensive analysis tools for LLM evaluation:
-    """)
+    st.markdown(_DASHBOARD_INTRO_MD)
     
     # Analysis options with links to dedicated pages
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("👥 Blind Evaluation Analysis")
-        st.markdown("""
-        **Human Evaluation Data Analysis**
-        - Statistical analysis with confidence intervals
-        - Multi-dimensional LLM performance comparison
-        - Rating distributions and significance testing
-        - Qualitative feedback analysis
-        """)
+        st.markdown(_DASHBOARD_BLIND_MD)
         if st.button("🔍 View Blind Evaluation Analysis", key="blind_analysis_btn"):
             st.switch_page("pages/blind_evaluation_analysis.py")
     
     with col2:
         st.subheader("⚡ Technical Metrics Analysis")
-        st.markdown("""
-        **Automated Performance Analysis**
-        - Performance metrics over time
-        - Latency, throughput, and reliability analysis
-        - Failure analysis and rate limit detection
-        - Industry-specific performance comparisons
-        """)
+        st.markdown(_DASHBOARD_TECHNICAL_MD)
         if st.button("📈 View Technical Metrics Analysis", key="tech_analysis_btn"):
             st.switch_page("pages/technical_metrics_analysis.py")
     
@@ -343,15 +373,78 @@ def show_analysis_dashboard():
     st.markdown("---")
     st.info("💡 **Tip**: Use the 'app' section in the sidebar for direct access to all analysis pages.")
 
+# Columns of the registration overview table and CSV export
+REGISTRATION_COLUMNS = ("Name", "Email", "Consent", "Registered", "Evaluation Complete")
+
+def format_registration_row(row):
+    """Format a registration snapshot row for display and export"""
+    name, email, consent, registered, completed = row
+    return (
+        name,
+        email,
+        "✅" if consent else "❌",
+        registered[:19].replace("T", " "),
+        "✅" if completed else "❌"
+    )
+
+@st.cache_data(show_spinner=False)
+def registrations_dataframe(version, rows):
+    """Build the registration overview table for a registration snapshot"""
+    return pd.DataFrame([format_registration_row(row) for row in rows], columns=REGISTRATION_COLUMNS)
+
+@st.cache_data(show_spinner=False)
+def registrations_csv(version, rows):
+    """Serialize a registration snapshot to CSV bytes for download"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(REGISTRATION_COLUMNS)
+    writer.writerows(format_registration_row(row) for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+@st.fragment
+def show_registration_management():
+    """Display the registration overview and export as an isolated fragment"""
+    with st.expander("👥 Registration Management"):
+        st.markdown("**Registered Testers Overview**")
+        
+        # Get registration data
+        version = get_registrations_version()
+        rows = get_registration_rows()
+        if rows:
+            # Display registrations in a table format
+            df = registrations_dataframe(version, rows)
+            st.dataframe(df, use_container_width=True)
+            
+            # Export functionality
+            st.download_button(
+                label="📥 Download Registration Data (CSV)",
+                data=registrations_csv(version, rows),
+                file_name=f"tester_registrations_v{version}.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("No registration data available.")
+
+@st.cache_resource(show_spinner=False)
+def probe_secrets():
+    """Inspect which secrets are configured (secrets are fixed for the process lifetime)"""
+    present = {"secrets": hasattr(st, "secrets"), "auth": False,
+               "admin_password": False, "tester_token": False, "sections": ()}
+    try:
+        if present["secrets"] and "auth" in st.secrets:
+            present["auth"] = True
+            present["admin_password"] = "admin_password" in st.secrets["auth"]
+            present["tester_token"] = "tester_access_token" in st.secrets["auth"]
+        present["sections"] = tuple(st.secrets.keys())
+    except Exception:
+        pass
+    return present
+
 def show_admin_panel():
     """Display the admin panel for system management"""
     st.header("⚙️ Administrator Panel")
     
-    st.markdown("""
-    ### System Management & Configuration
-    
-    Administrative tools for managing the LLM evaluation system.
-    """)
+    st.markdown(_ADMIN_PANEL_INTRO_MD)
     
     # Registration Statistics Section
     st.subheader("📊 Registration Statistics")
@@ -367,42 +460,7 @@ def show_admin_panel():
         st.metric("Completed Evaluations", stats["completed_evaluations"])
     
     # Registration Management
-    with st.expander("👥 Registration Management"):
-        st.markdown("**Registered Testers Overview**")
-        
-        # Get registration data
-        storage_key = "tester_registrations"
-        if storage_key in st.session_state and st.session_state[storage_key]:
-            registrations = st.session_state[storage_key]
-            
-            # Display registrations in a table format
-            registration_data = []
-            for email, reg in registrations.items():
-                registration_data.append({
-                    "Name": reg.get("name", "N/A"),
-                    "Email": email,
-                    "Consent": "✅" if reg.get("consent_given", False) else "❌",
-                    "Registered": reg.get("registration_timestamp", "")[:19].replace("T", " "),
-                    "Evaluation Complete": "✅" if reg.get("evaluation_completed", False) else "❌"
-                })
-            
-            if registration_data:
-                import pandas as pd
-                df = pd.DataFrame(registration_data)
-                st.dataframe(df, use_container_width=True)
-                
-                # Export functionality
-                csv = df.to_csv(index=False)
-                st.download_button(
-                    label="📥 Download Registration Data (CSV)",
-                    data=csv,
-                    file_name=f"tester_registrations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("No registrations found.")
-        else:
-            st.info("No registration data available.")
+    show_registration_management()
     
     # Admin sections
     col1, col2 = st.columns(2)
@@ -417,6 +475,7 @@ def show_admin_panel():
             if st.checkbox("⚠️ I understand this will delete all registration data"):
                 if "tester_registrations" in st.session_state:
                     del st.session_state["tester_registrations"]
+                bump_registrations_version()
                 st.success("✅ Registration data cleared")
                 st.rerun()
     
@@ -427,16 +486,38 @@ def show_admin_panel():
         st.subheader("🔍 System Monitoring")
         st.info("🚧 Monitor system health and performance")
         
-        # Storage information
-        st.markdown("**Storage Status**")
-        total_sessions = len(st.session_state.keys())
-        st.write(f"Session state keys: {total_sessions}")
-        
-        if "tester_registrations" in st.session_state:
-            reg_count = len(st.session_state["tester_registrations"])
-            st.write(f"Stored registrations: {reg_count}")
-        else:
-            st.write("Stored registrations: 0")
+        # Configuration and storage status
+        secrets = probe_secrets()
+        status_rows = [
+            ("Admin password", "✅" if secrets["admin_password"] else "❌"),
+            ("Tester access token", "✅" if secrets["tester_token"] else "❌"),
+            ("Secret sections", ", ".join(secrets["sections"]) or "none"),
+            ("Session state keys", str(len(st.session_state))),
+            ("Stored registrations", str(len(get_session_registrations()))),
+        ]
+        st.dataframe(
+            pd.DataFrame(status_rows, columns=("Item", "Status")),
+            hide_index=True,
+            use_container_width=True
+        )
+
+# Navigation entry -> (page source, required role, icon, URL path)
+_ROUTES = {
+    "Home": (show_home, None, "🏠", "home"),
+    # Registration shares the evaluation URL, so the rerun after registering
+    # lands on the evaluation itself
+    "Blind Evaluation": (show_blind_evaluation, "tester", "🔍", "blind-evaluation"),
+    "Tester Registration": (show_tester_registration, None, "📝", "blind-evaluation"),
+    "Analysis Dashboard": (show_analysis_dashboard, "admin", "📊", "analysis-dashboard"),
+    "Admin Panel": (show_admin_panel, "admin", "⚙️", "admin-panel"),
+    "RAG Demo": ("pages/rag_demo.py", None, "🧠", None),
+    "Blind Evaluation Analysis": ("pages/blind_evaluation_analysis.py", None, "👥", None),
+    "Technical Metrics Analysis": ("pages/technical_metrics_analysis.py", None, "⚡", None),
+    "Provider Comparison Analysis": ("pages/provider_comparison.py", None, "🏢", None),
+    "Analysis Hub": ("pages/analysis.py", None, "🔬", None),
+    "LLM Health Check": ("pages/llm_health_check.py", None, "🤖", None),
+    "Admin Login": (show_admin_login_page, None, "🔐", "admin-login"),
+}
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,13 +1,62 @@
 import os
+import re
+import csv
 import json
 import time
-import csv
+import base64
+import hashlib
+import random
+import threading
 from datetime import datetime, timezone
 from typing import List, Dict, Any
-import pandas as pd # Added for appending to CSV
-from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    import google_crc32c
+    CRC32C_AVAILABLE = True
+except ImportError:
+    CRC32C_AVAILABLE = False
+
+def loads_json(data):
+    """Parse JSON from str or bytes, with orjson when it is installed"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 # --- BEGIN: Streamlit secrets GCS credential support ---
+SECRETS_PATH = os.path.join(".streamlit", "secrets.toml")
+def write_credentials_file(service_account_info) -> str:
+    """
+    Write service account info to a credentials file named by its content hash.
+
+    Every evaluation run starts a new process, so a fresh temp file per run
+    would leave one copy of the key behind each minute. The same credentials
+    always map to the same file, which is only written when missing.
+    """
+    import tempfile
+    payload = json.dumps(service_account_info, sort_keys=True)
+    digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+    cred_path = os.path.join(tempfile.gettempdir(), f"gcs-credentials-{digest}.json")
+    if not os.path.exists(cred_path):
+        fd, temp_path = tempfile.mkstemp(suffix=".json", dir=os.path.dirname(cred_path))
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(temp_path, cred_path)
+    return cred_path
+
 def setup_gcs_credentials():
     """Set up GCS credentials from various sources"""
     try:
@@ -35,11 +84,8 @@ def setup_gcs_credentials():
             
             if service_account_info:
                 if isinstance(service_account_info, str):
-                    service_account_info = json.loads(service_account_info)
-                import tempfile
-                with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-                    json.dump(service_account_info, f)
-                    temp_cred_path = f.name
+                    service_account_info = loads_json(service_account_info)
+                temp_cred_path = write_credentials_file(dict(service_account_info))
                 os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = temp_cred_path
                 if bucket_name:
                     os.environ["GCS_BUCKET"] = bucket_name
@@ -51,12 +97,11 @@ def setup_gcs_credentials():
             print(f"[WARN] Could not use Streamlit secrets: {e}")
             
         # Third try: Read secrets.toml directly (for local development)
-        secrets_path = ".streamlit/secrets.toml"
-        if os.path.exists(secrets_path):
+        if os.path.exists(SECRETS_PATH):
             print("[INFO] Reading credentials from .streamlit/secrets.toml")
             try:
                 import toml
-                secrets = toml.load(secrets_path)
+                secrets = toml.load(SECRETS_PATH)
                 
                 service_account_info = None
                 bucket_name = None
@@ -73,12 +118,9 @@ def setup_gcs_credentials():
                 if service_account_info:
                     # Handle string format (your case)
                     if isinstance(service_account_info, str):
-                        service_account_info = json.loads(service_account_info)
+                        service_account_info = loads_json(service_account_info)
                     
-                    import tempfile
-                    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-                        json.dump(service_account_info, f)
-                        temp_cred_path = f.name
+                    temp_cred_path = write_credentials_file(service_account_info)
                     os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = temp_cred_path
                     
                     # Set bucket name if available
@@ -103,16 +145,48 @@ def setup_gcs_credentials():
         print(f"[ERROR] Error setting up GCS credentials: {e}")
         return False
 
+def secrets_mtime() -> float:
+    """Modification time of secrets.toml, or 0.0 when there is none"""
+    try:
+        return os.path.getmtime(SECRETS_PATH)
+    except OSError:
+        return 0.0
+
+@lru_cache(maxsize=4)
+def setup_gcs_credentials_cached(secrets_version: float) -> bool:
+    """Run setup_gcs_credentials once per secrets.toml version in this process"""
+    return setup_gcs_credentials()
+
+def ensure_gcs_credentials() -> bool:
+    """
+    Set up credentials once per process tree and secrets.toml version.
+
+    GCS_SETUP_DONE records the secrets.toml mtime the setup ran against and is
+    inherited by child processes, which then skip the TOML parse entirely.
+    """
+    version = secrets_mtime()
+    done = os.environ.get("GCS_SETUP_DONE")
+    if done == repr(version):
+        return True
+    cred_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "")
+    if done is not None and os.path.basename(cred_path).startswith("gcs-credentials-"):
+        # secrets.toml changed since this file was written from it; rebuild it
+        del os.environ["GOOGLE_APPLICATION_CREDENTIALS"]
+    if setup_gcs_credentials_cached(version):
+        os.environ["GCS_SETUP_DONE"] = repr(version)
+        return True
+    return False
+
 # Set up credentials at startup
-setup_gcs_credentials()
+ensure_gcs_credentials()
 # --- END: Streamlit secrets GCS credential support ---
 
-from utils.rag_pipeline import build_rag_index, retrieve_context
+from utils.rag_pipeline import build_rag_index, retrieve_contexts_with_embeddings
 from utils.llm_clients import get_llm_client
 from utils.prompts import build_prompt
 from utils.embedding import get_embedding_model, embed_texts
 from utils.vector_db import VectorDB
-from utils.data_loader import load_csv_dataset, load_text_dataset
+from utils.data_loader import CSV_ENGINE, load_csv_dataset, load_text_dataset
 from utils.chunking import chunk_documents
 from google.cloud import storage
 
@@ -123,12 +197,23 @@ INDUSTRY_TO_DATASET = {
     "retail": "data/shopping_trends.csv",
     "finance": "data/Tesla_stock_data.csv"
 }
-OUTPUT_JSON = os.path.join('data', 'batch_eval_metrics.json')
+# Metrics are appended as JSON Lines, one record per line
+OUTPUT_JSON = os.path.join('data', 'batch_eval_metrics.jsonl')
+# Earlier runs kept the whole history in one JSON array
+LEGACY_OUTPUT_JSON = os.path.join('data', 'batch_eval_metrics.json')
 OUTPUT_CSV = os.path.join('data', 'batch_eval_metrics.csv')
 GCS_BUCKET = os.environ.get('GCS_BUCKET', 'llm-evaluation-data')
-GCS_JSON_BLOB = 'batch_eval_metrics.json'
+GCS_JSON_BLOB = 'batch_eval_metrics.jsonl'
 GCS_CSV_BLOB = 'batch_eval_metrics.csv'
-GCP_CREDENTIALS = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')  # Path to service account JSON
+GCS_UPLOAD_TIMEOUT = 120  # Seconds per upload request
+GCS_CHUNK_SIZE = 8 * 1024 * 1024  # Resumable upload chunk, a multiple of 256 KiB
+CHECKSUM_READ_SIZE = 1024 * 1024  # Bytes read per step when checksumming a local file
+UPLOAD_CHECKSUM = "crc32c" if CRC32C_AVAILABLE else "md5"
+GCS_CONTENT_TYPES = {
+    '.jsonl': 'application/x-ndjson',
+    '.csv': 'text/csv',
+}
+CSV_WRITE_BUFFER = 64 * 1024  # Bytes buffered per write when appending metrics
 
 # LLMs to evaluate
 LLMS = [
@@ -138,241 +223,459 @@ LLMS = [
     {"provider": "openrouter", "model": "deepseek/deepseek-r1-0528-qwen3-8b"},
 ]
 
+# tiktoken encoding used for prompt/response token counts
+TOKEN_ENCODING = "cl100k_base"
+
+# Word tokens used for coverage scoring
+_WORD_RE = re.compile(r"\w+")
+
+# Error classification, checked in order; the first matching pattern wins
+ERROR_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), error_type)
+    for pattern, error_type in (
+        (r"rate limit|too many requests|429|quota exceeded", "rate_limit"),
+        (r"timeout|timed out|time out", "timeout"),
+        (r"network|connection|dns|unreachable", "network"),
+        (r"api|invalid request|bad request|400|401|403|404|500|502|503|504", "api_error"),
+        (r"service unavailable|maintenance|offline", "service_unavailable"),
+        (r"authentication|unauthorized|forbidden", "auth_error"),
+    )
+]
+
+# Longest wait honoured from a provider's Retry-After header
+MAX_RETRY_DELAY = 60
+
+# Chunks encoded per embedding forward pass when building an index
+EMBED_BATCH_SIZE = 512
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+# Chunk embeddings reused across runs while the dataset is unchanged
+RAG_CACHE_DIR = '.rag_cache'
+
+# Concurrent requests allowed per provider across the whole batch
+PROVIDER_CONCURRENCY = {
+    "groq": 8,
+    "openrouter": 16,
+}
+DEFAULT_PROVIDER_CONCURRENCY = 4
+
+# Free-tier requests per minute; providers not listed are not throttled
+PROVIDER_RPM = {
+    "groq": 30,
+    "openrouter": 20,
+}
+RATE_WINDOW_SECONDS = 60
+
 # ---- UTILS ----
 def load_questions(path: str) -> Dict[str, List[str]]:
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+@lru_cache(maxsize=None)
+def get_token_encoder(encoding_name: str = TOKEN_ENCODING):
+    """Return the tiktoken encoder for an encoding, or None to fall back to whitespace counts"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        print(f"[WARN] Could not load tiktoken encoding {encoding_name}, using whitespace token counts: {e}")
+        return None
+
+def count_tokens(text, encoding_name: str = TOKEN_ENCODING):
+    if not text:
+        return 0
+    encoder = get_token_encoder(encoding_name)
+    if encoder is None:
+        # Simple whitespace tokenizer fallback
+        return len(text.split())
+    return len(encoder.encode(text, disallowed_special=()))
+
+@lru_cache(maxsize=None)
+def get_cached_llm_client(provider: str, model: str):
+    """Create each provider/model client once so its HTTP session is reused.
 
-def count_tokens(text):
-    # Simple whitespace tokenizer fallback
-    return len(text.split()) if text else 0
+    The client makes a single attempt; call_llm owns retries so it sees the
+    HTTP status and Retry-After header of every failure.
+    """
+    return get_llm_client(provider, model, max_retries=1)
+
+@lru_cache(maxsize=1)
+def get_gcs_client():
+    """Create the storage client once per process"""
+    return storage.Client()
+
+def file_checksum(path: str) -> str:
+    """Base64 CRC32C (or MD5 without google_crc32c) of a file, as GCS reports it"""
+    checksum = google_crc32c.Checksum() if CRC32C_AVAILABLE else hashlib.md5()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHECKSUM_READ_SIZE), b''):
+            checksum.update(block)
+    return base64.b64encode(checksum.digest()).decode('ascii')
 
 def upload_to_gcs(local_path: str, bucket_name: str, blob_name: str):
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
+    bucket = get_gcs_client().bucket(bucket_name)
+    # Fetching metadata is much cheaper than re-sending identical content
+    remote = bucket.get_blob(blob_name, timeout=GCS_UPLOAD_TIMEOUT)
+    if remote is not None:
+        remote_checksum = remote.crc32c if CRC32C_AVAILABLE else remote.md5_hash
+        if remote_checksum and remote_checksum == file_checksum(local_path):
+            print(f"Skipped upload of {local_path}, gs://{bucket_name}/{blob_name} is unchanged")
+            return
     blob = bucket.blob(blob_name)
-    blob.upload_from_filename(local_path)
+    # Small files go up in one request; larger ones as a resumable upload
+    # streamed from disk in GCS_CHUNK_SIZE pieces
+    blob.chunk_size = GCS_CHUNK_SIZE if os.path.getsize(local_path) > GCS_CHUNK_SIZE else None
+    content_type = GCS_CONTENT_TYPES.get(os.path.splitext(local_path)[1], 'application/octet-stream')
+    with open(local_path, 'rb') as f:
+        blob.upload_from_file(f, rewind=True, content_type=content_type, checksum=UPLOAD_CHECKSUM,
+                              timeout=GCS_UPLOAD_TIMEOUT)
     print(f"Uploaded {local_path} to gs://{bucket_name}/{blob_name}")
 
-def save_json(data: List[Dict[str, Any]], path: str):
-    if not data:
+def json_line(record: Dict[str, Any]) -> bytes:
+    """Serialize one metric record as a newline-terminated JSON line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    return (json.dumps(record) + "\n").encode('utf-8')
+
+def migrate_legacy_json(legacy_path: str, path: str):
+    """Convert a JSON array metrics file to JSON Lines once, before the first append"""
+    if os.path.exists(path) or not os.path.exists(legacy_path):
         return
-    
-    # If file exists, load existing data and combine with new data
-    if os.path.exists(path):
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-            combined_data = existing_data + data
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(combined_data, f, indent=2)
-        except Exception as e:
-            print(f"Warning: Could not append to existing JSON, overwriting: {e}")
-            # Fallback to overwrite if there's an issue
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-    else:
-        # Create new file
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+    with open(legacy_path, 'rb') as f:
+        records = loads_json(f.read())
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.writelines(json_line(record) for record in records)
+    os.replace(temp_path, path)
+    print(f"[INFO] Migrated {len(records)} records from {legacy_path} to {path}")
 
 def save_csv(data: List[Dict[str, Any]], path: str):
     if not data:
         return
-    
-    # Check if file exists to determine if we need to write header
-    file_exists = os.path.exists(path)
-    
-    # If file exists, load existing data and combine with new data
-    if file_exists:
-        try:
-            existing_df = pd.read_csv(path)
-            new_df = pd.DataFrame(data)
-            combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-            combined_df.to_csv(path, index=False)
-        except Exception as e:
-            print(f"Warning: Could not append to existing CSV, overwriting: {e}")
-            # Fallback to overwrite if there's an issue
-            with open(path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=list(data[0].keys()))
-                writer.writeheader()
-                writer.writerows(data)
-    else:
-        # Create new file
-        with open(path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=list(data[0].keys()))
+    fieldnames = list(data[0].keys())
+    header = None
+    if os.path.exists(path):
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), None)
+    if header and header != fieldnames:
+        # The columns changed since the file was started; rewrite it once with
+        # the old columns first and the new ones appended, then append as usual
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            existing_rows = list(csv.DictReader(f))
+        fieldnames = header + [name for name in fieldnames if name not in header]
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(existing_rows)
+        os.replace(temp_path, path)
+    # Only the new rows are written; the history is never re-read or rewritten
+    with open(path, 'a', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        if not header:
             writer.writeheader()
-            writer.writerows(data)
+        writer.writerows(data)
+
+def classify_error(message: str) -> str:
+    """Map an exception message to an error_type for the metrics"""
+    for pattern, error_type in ERROR_PATTERNS:
+        if pattern.search(message):
+            return error_type
+    return "other"
+
+def http_status_of(error):
+    """Return the HTTP status attached to a requests-style exception, if any"""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) if response is not None else None
+
+def retry_delay(error, retry_count: int) -> float:
+    """Seconds to wait before the next attempt, honouring Retry-After when sent"""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    # Exponential backoff with jitter so parallel calls don't retry in lockstep
+    return min(MAX_RETRY_DELAY, 2 ** retry_count + random.random())
+
+class RequestRateLimiter:
+    """Sliding-window limit on requests started per window, shared across threads"""
+
+    def __init__(self, max_requests: int, window: float = RATE_WINDOW_SECONDS):
+        self.max_requests = max_requests
+        self.window = window
+        self._started = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until another request fits in the window, then record it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._started and now - self._started[0] >= self.window:
+                    self._started.popleft()
+                if len(self._started) < self.max_requests:
+                    self._started.append(now)
+                    return
+                wait = self.window - (now - self._started[0])
+            time.sleep(wait)
 
-def compute_coverage(answer: str, context_chunks: list) -> float:
+# Module-level so the window spans batches, not just one run_single_batch call
+PROVIDER_RATE_LIMITERS = {
+    provider: RequestRateLimiter(rpm) for provider, rpm in PROVIDER_RPM.items()
+}
+
+def context_word_set(context_texts: list) -> frozenset:
+    """Build the lowercase word set of the context, once per question."""
+    return frozenset(_WORD_RE.findall(" ".join(context_texts).lower()))
+
+def compute_coverage(answer: str, context_words: frozenset) -> float:
     """Compute the fraction of answer words that appear in the context."""
-    import re
-    answer_words = set(re.findall(r"\w+", answer.lower()))
-    context_text = " ".join(context_chunks).lower()
-    context_words = set(re.findall(r"\w+", context_text))
+    if not answer:
+        return 0.0  # Failed calls have no response to tokenize
+    answer_words = frozenset(_WORD_RE.findall(answer.lower()))
     if not answer_words:
         return 0.0
-    overlap = answer_words & context_words
-    return len(overlap) / len(answer_words)
-
-def build_rag_index_with_collection(dataset_path: str, collection_name: str, dataset_type: str = "csv", text_column: str = None, chunk_size: int = 500, overlap: int = 50) -> VectorDB:
-    # Load data
-    if dataset_type == "csv":
-        docs = load_csv_dataset(dataset_path, text_column=text_column)
-    elif dataset_type == "text":
-        docs = load_text_dataset(dataset_path)
-    else:
+    return len(answer_words & context_words) / len(answer_words)
+
+def rag_cache_fingerprint(dataset_path: str, dataset_type: str, text_column: str, chunk_size: int, overlap: int) -> str:
+    """Identify a dataset version and chunking/embedding setup"""
+    stat = os.stat(dataset_path)
+    key = "|".join(str(part) for part in (
+        os.path.abspath(dataset_path), stat.st_mtime_ns, stat.st_size,
+        dataset_type, text_column, chunk_size, overlap, EMBEDDING_MODEL_NAME, CSV_ENGINE))
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+def load_cached_chunks(cache_path: str, fingerprint: str):
+    """Return (chunks, embeddings) from the cache, or None if missing or stale"""
+    try:
+        with np.load(cache_path) as cached:
+            if str(cached["fingerprint"]) != fingerprint:
+                return None
+            return cached["chunks"].tolist(), cached["embeddings"].tolist()
+    except (OSError, KeyError, ValueError):
+        return None
+
+def save_cached_chunks(cache_path: str, fingerprint: str, chunks: List[str], embeddings: List[list]):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    temp_path = f"{cache_path}.tmp.npz"
+    np.savez(temp_path, fingerprint=np.array(fingerprint), chunks=np.array(chunks, dtype=str),
+             embeddings=np.asarray(embeddings, dtype=np.float32))
+    os.replace(temp_path, cache_path)
+
+# Dataset loaders by type, called as loader(path, text_column)
+_LOADERS = {
+    "csv": lambda path, text_column: load_csv_dataset(path, text_column=text_column),
+    "text": lambda path, text_column: load_text_dataset(path),
+}
+
+def build_rag_index_with_collection(dataset_path: str, collection_name: str, dataset_type: str = "csv", text_column: str = None, chunk_size: int = 500, overlap: int = 50, model=None) -> VectorDB:
+    loader = _LOADERS.get(dataset_type)
+    if loader is None:
         raise ValueError("Unsupported dataset type: must be 'csv' or 'text'")
-    # Chunk documents
-    chunks = chunk_documents(docs, chunk_size=chunk_size, overlap=overlap)
-    # Get embedding model
-    model = get_embedding_model()
-    # Embed chunks
-    embeddings = embed_texts(chunks, model)
+    # Reuse chunks and embeddings from a previous run if the dataset is unchanged
+    cache_path = os.path.join(RAG_CACHE_DIR, f"{collection_name}.npz")
+    fingerprint = rag_cache_fingerprint(dataset_path, dataset_type, text_column, chunk_size, overlap)
+    cached = load_cached_chunks(cache_path, fingerprint)
+    if cached is not None:
+        chunks, embeddings = cached
+    else:
+        # Load data
+        docs = loader(dataset_path, text_column)
+        # Chunk documents
+        chunks = chunk_documents(docs, chunk_size=chunk_size, overlap=overlap)
+        # Get embedding model
+        if model is None:
+            model = get_embedding_model(EMBEDDING_MODEL_NAME)
+        # Embed chunks
+        # Unit-length vectors, as the inner-product index below requires
+        embeddings = embed_texts(chunks, model, batch_size=min(EMBED_BATCH_SIZE, len(chunks)),
+                                 normalize_embeddings=True)
+        try:
+            save_cached_chunks(cache_path, fingerprint, chunks, embeddings)
+        except OSError as e:
+            print(f"[WARN] Could not cache embeddings for {collection_name}: {e}")
     # Prepare metadata
     metadatas = [{"text": chunk, "chunk_id": i} for i, chunk in enumerate(chunks)]
-    # Build vector DB with unique collection name (in-memory only)
-    vector_db = VectorDB(collection_name=collection_name)
+    # Build vector DB with unique collection name (in-memory only).
+    # Embeddings are unit length, so inner product ranks like cosine without the norms.
+    vector_db = VectorDB(collection_name=collection_name, metric="ip")
     vector_db.add_documents(embeddings, metadatas)
     return vector_db
 
+# Every dataset in INDUSTRY_TO_DATASET is a CSV indexed with the default chunking
+build_csv_rag_index = partial(build_rag_index_with_collection, dataset_type="csv", text_column=None, chunk_size=500, overlap=50)
+
+def sample_questions(questions: Dict[str, List[str]], k: int, rng: random.Random) -> List[tuple]:
+    """Pick k distinct (industry, question) pairs without flattening the question bank"""
+    total = sum(len(qs) for qs in questions.values())
+    picks = sorted(rng.sample(range(total), min(k, total)))
+    selected = []
+    offset = 0
+    remaining = iter(picks)
+    pick = next(remaining, None)
+    for industry, qs in questions.items():
+        # Map each global index that falls inside this industry back to its question
+        while pick is not None and pick < offset + len(qs):
+            selected.append((industry, qs[pick - offset]))
+            pick = next(remaining, None)
+        offset += len(qs)
+    return selected
+
 def run_single_batch(batch_id=None):
     # Load questions
     questions = load_questions(QUESTIONS_PATH)
-    # Build RAG index and embedding model for each industry
-    rag_indices = {}
-    embedding_models = {}
-    for industry, dataset_path in INDUSTRY_TO_DATASET.items():
-        print(f"Building RAG index for {industry} ({dataset_path})...")
-        collection_name = f"rag_collection_{industry}"
-        rag_indices[industry] = build_rag_index_with_collection(dataset_path, collection_name, dataset_type="csv")
-        embedding_models[industry] = get_embedding_model()
+    # Build a RAG index for each industry with one shared embedding model
+    embedding_model = get_embedding_model(EMBEDDING_MODEL_NAME)
+    # Industries are independent, so loading one dataset overlaps embedding another
+    with ThreadPoolExecutor(max_workers=len(INDUSTRY_TO_DATASET)) as executor:
+        futures = {}
+        for industry, dataset_path in INDUSTRY_TO_DATASET.items():
+            print(f"Building RAG index for {industry} ({dataset_path})...")
+            futures[industry] = executor.submit(
+                build_csv_rag_index, dataset_path, f"rag_collection_{industry}", model=embedding_model)
+        rag_indices = {industry: future.result() for industry, future in futures.items()}
     # --- Select 5 random questions across all industries ---
-    import random
-    all_questions = []
-    for industry, qs in questions.items():
-        for q in qs:
-            all_questions.append((industry, q))
-    selected = random.sample(all_questions, min(5, len(all_questions)))
+    # BATCH_EVAL_SEED makes the selection reproducible; unset, each batch differs
+    rng = random.Random(os.environ.get("BATCH_EVAL_SEED"))
+    selected = sample_questions(questions, 5, rng)
     # Main evaluation loop
     all_metrics = []
-    batch_timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-    for industry, q in selected:
-        rag_index = rag_indices[industry]
-        embedding_model = embedding_models[industry]
-        context_chunks = retrieve_context(q, rag_index, embedding_model, top_k=5)
-        prompt = build_prompt(q, context_chunks)
-        # LLM calls in parallel
-        def call_llm(llm, prompt, context_chunks):
-            client = get_llm_client(llm["provider"], llm["model"])
-            retry_count = 0
-            max_retries = 3
-            latency = None
-            response = ""
-            response_tokens = 0
-            prompt_tokens = count_tokens(prompt)
-            total_tokens = prompt_tokens
-            throughput = 0
-            success = False
-            error = None
-            rate_limit_hit = False
-            error_type = None
-            http_status = None
-            final_error = None
-            
+    # One string shared by every metric row of the batch
+    batch_timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds").replace('+00:00', 'Z')
+    # Per-provider limits keep the shared pool within each provider's rate limits
+    provider_slots = {
+        llm["provider"]: threading.BoundedSemaphore(
+            PROVIDER_CONCURRENCY.get(llm["provider"], DEFAULT_PROVIDER_CONCURRENCY))
+        for llm in LLMS
+    }
+    def call_llm(industry, q, prompt, prompt_tokens, ctx_texts, context_words, llm):
+        client = get_cached_llm_client(llm["provider"], llm["model"])
+        retry_count = 0
+        max_retries = 3
+        # Failure values; only a successful attempt overwrites them
+        latency = None
+        response = ""
+        response_tokens = 0
+        total_tokens = prompt_tokens
+        throughput = 0
+        success = False
+        rate_limit_hit = False
+        error_type = None
+        http_status = None
+        final_error = None
+        
+        rate_limiter = PROVIDER_RATE_LIMITERS.get(llm["provider"])
+        with provider_slots[llm["provider"]]:
             while retry_count < max_retries:
-                start = time.time()
+                # Throttle before sending rather than waiting for a 429
+                if rate_limiter is not None:
+                    rate_limiter.acquire()
+                start = time.perf_counter()
                 try:
                     response = client.generate(prompt)
-                    latency = time.time() - start
+                    latency = time.perf_counter() - start
                     response_tokens = count_tokens(response)
                     total_tokens = prompt_tokens + response_tokens
                     throughput = response_tokens / latency if latency and latency > 0 else 0
                     success = True
-                    error = None
                     rate_limit_hit = False
                     error_type = None
+                    http_status = None
                     final_error = None
                     break
                 except Exception as e:
                     latency = None
-                    response = ""
-                    response_tokens = 0
-                    total_tokens = prompt_tokens
-                    throughput = 0
-                    success = False
                     final_error = str(e)
                     
                     # Enhanced error parsing for type and rate limit
-                    err_str = str(e).lower()
-                    if any(x in err_str for x in ["rate limit", "too many requests", "429", "quota exceeded"]):
+                    error_type = classify_error(final_error)
+                    if error_type == "rate_limit":
                         rate_limit_hit = True
-                        error_type = "rate_limit"
-                    elif any(x in err_str for x in ["timeout", "timed out", "time out"]):
-                        error_type = "timeout"
-                    elif any(x in err_str for x in ["network", "connection", "dns", "unreachable"]):
-                        error_type = "network"
-                    elif any(x in err_str for x in ["api", "invalid request", "bad request", "400", "401", "403", "404", "500", "502", "503", "504"]):
-                        error_type = "api_error"
-                    elif any(x in err_str for x in ["service unavailable", "maintenance", "offline"]):
-                        error_type = "service_unavailable"
-                    elif any(x in err_str for x in ["authentication", "unauthorized", "forbidden"]):
-                        error_type = "auth_error"
-                    else:
-                        error_type = "other"
+                    
+                    http_status = http_status_of(e)
                     
                     print(f"[ERROR] {llm['provider']}/{llm['model']} attempt {retry_count + 1}/{max_retries} failed: {error_type} - {final_error}")
                     
                     retry_count += 1
+                    if http_status is not None and 400 <= http_status < 500 and http_status != 429:
+                        break  # The same request will be rejected again
                     if retry_count < max_retries:
-                        time.sleep(2 ** retry_count)  # Exponential backoff
-            # Response quality metrics
-            response_length = len(response) if response else 0
-            response_contains_context = False
-            for chunk in context_chunks:
-                chunk_text = chunk if isinstance(chunk, str) else chunk.get('text', '')
-                if chunk_text and chunk_text in response:
-                    response_contains_context = True
-                    break
-            # Compute coverage score (fraction of answer words in context)
-            coverage_score = compute_coverage(response, [chunk if isinstance(chunk, str) else chunk.get('text', '') for chunk in context_chunks])
-            # Try to get HTTP status if available (requires client to expose it)
-            # For now, set to None
-            return {
-                "timestamp": batch_timestamp,
-                "industry": industry,
-                "question": q,
-                "llm_provider": llm["provider"],
-                "llm_model": llm["model"],
-                "latency_sec": latency,
-                "prompt_tokens": prompt_tokens,
-                "response_tokens": response_tokens,
-                "total_tokens": total_tokens,
-                "throughput_tps": throughput,
-                "success": success,
-                "error": final_error,
-                "batch_id": batch_id,
-                "retry_count": retry_count,
-                "rate_limit_hit": rate_limit_hit,
-                "error_type": error_type,
-                "response_length": response_length,
-                "response_contains_context": response_contains_context,
-                "coverage_score": coverage_score,
-                "http_status": http_status
-            }
-        with ThreadPoolExecutor(max_workers=len(LLMS)) as executor:
-            results = list(executor.map(lambda llm: call_llm(llm, prompt, context_chunks), LLMS))
-        all_metrics.extend(results)
+                        time.sleep(retry_delay(e, retry_count))
+        # Response quality metrics
+        response_length = len(response) if response else 0
+        response_contains_context = any(text and text in response for text in ctx_texts)
+        # Compute coverage score (fraction of answer words in context)
+        coverage_score = compute_coverage(response, context_words)
+        return {
+            "timestamp": batch_timestamp,
+            "industry": industry,
+            "question": q,
+            "llm_provider": llm["provider"],
+            "llm_model": llm["model"],
+            "latency_sec": latency,
+            "prompt_tokens": prompt_tokens,
+            "response_tokens": response_tokens,
+            "total_tokens": total_tokens,
+            "throughput_tps": throughput,
+            "success": success,
+            "error": final_error,
+            "batch_id": batch_id,
+            "retry_count": retry_count,
+            "rate_limit_hit": rate_limit_hit,
+            "error_type": error_type,
+            "response_length": response_length,
+            "response_contains_context": response_contains_context,
+            "coverage_score": coverage_score,
+            "http_status": http_status
+        }
+    # Embed every selected question in one forward pass, then issue one
+    # batched query per industry
+    query_embeddings = embed_texts([q for _, q in selected], embedding_model, normalize_embeddings=True)
+    embeddings_by_industry = {}
+    for (industry, q), query_embedding in zip(selected, query_embeddings):
+        embeddings_by_industry.setdefault(industry, []).append((q, query_embedding))
+    contexts = {}
+    for industry, pairs in embeddings_by_industry.items():
+        results = retrieve_contexts_with_embeddings([emb for _, emb in pairs], rag_indices[industry], top_k=5)
+        contexts.update(((industry, q), context_chunks) for (q, _), context_chunks in zip(pairs, results))
+    # Then fan all question x LLM calls out at once
+    jobs = []
+    for industry, q in selected:
+        context_chunks = contexts[(industry, q)]
+        prompt = build_prompt(q, context_chunks)
+        # Chunk texts are extracted once and shared by every LLM for the question
+        ctx_texts = [chunk if isinstance(chunk, str) else chunk.get('text', '') for chunk in context_chunks]
+        context_words = context_word_set(ctx_texts)
+        prompt_tokens = count_tokens(prompt)
+        jobs.extend((industry, q, prompt, prompt_tokens, ctx_texts, context_words, llm) for llm in LLMS)
+    migrate_legacy_json(LEGACY_OUTPUT_JSON, OUTPUT_JSON)
+    # Each record is appended to the JSON Lines file in completion order, so a
+    # slow model does not hold back the records of calls that already finished
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as executor, open(OUTPUT_JSON, 'ab') as json_out:
+        futures = [executor.submit(call_llm, *job) for job in jobs]
+        for future in as_completed(futures):
+            metric = future.result()
+            json_out.write(json_line(metric))
+            all_metrics.append(metric)
     # Save results
-    save_json(all_metrics, OUTPUT_JSON)
     save_csv(all_metrics, OUTPUT_CSV)
     print(f"[INFO] Saved batch evaluation data locally: {OUTPUT_JSON}, {OUTPUT_CSV}")
-    try:
-        upload_to_gcs(OUTPUT_JSON, GCS_BUCKET, GCS_JSON_BLOB)
-        upload_to_gcs(OUTPUT_CSV, GCS_BUCKET, GCS_CSV_BLOB)
+    uploads = [(OUTPUT_JSON, GCS_BUCKET, GCS_JSON_BLOB), (OUTPUT_CSV, GCS_BUCKET, GCS_CSV_BLOB)]
+    with ThreadPoolExecutor(max_workers=len(uploads)) as executor:
+        futures = {executor.submit(upload_to_gcs, *upload): upload[0] for upload in uploads}
+    # Each upload is checked on its own so one failure doesn't hide the other
+    failed = False
+    for future, local_path in futures.items():
+        try:
+            future.result()
+        except Exception as e:
+            failed = True
+            print(f"[WARN] Could not upload {local_path} to GCS: {e}")
+    if not failed:
         print(f"[INFO] Uploaded batch evaluation data to GCS bucket: {GCS_BUCKET}")
-    except Exception as e:
-        print(f"[WARN] Could not upload to GCS: {e}")
     print(f"Batch evaluation complete. {len(all_metrics)} records saved.")
 
 def main():
@@ -6,118 +6,273 @@ Shows live statistics, current phase, and progress.
 """
 
 import os
+import re
 import sys
 import time
-import subprocess
 from datetime import datetime, timedelta
 import json
 
+# Optional inotify support (Linux) to redraw as soon as the log changes
+try:
+    from inotify_simple import INotify, flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-def clear_screen():
-    """Clear the terminal screen"""
-    os.system('clear' if os.name == 'posix' else 'cls')
+from automation.process_lookup import find_pids
+
+LOG_FILE = "automation/real_world_simulator.log"
+STATE_FILE = "automation/.dashboard_state.json"
+READ_BLOCK_SIZE = 64 * 1024
+REFRESH_SECONDS = 10
+
+# ANSI sequences for in-place redraws
+CURSOR_HOME = "\x1b[H"
+CLEAR_LINE = "\x1b[K"
+CLEAR_TO_END = "\x1b[J"
+
+# Simulator log events the dashboard tracks
+EVENT_INTENSIVE_STARTED = b"Starting INTENSIVE phase"
+EVENT_REST_STARTED = b"Switching to REST phase"
+EVENT_EVALUATION_STARTED = b"Starting evaluation #"
+EVENT_EVALUATION_SUCCEEDED = b"completed successfully"
+
+# Log line layout: "<asctime> - <levelname> - <message>"
+_LOG_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - \w+ - (.*)$')
+# Classifies each event line by its first tracked event; other lines that
+# mention both "evaluation" and "failed" count as failures
+_EVENT_LINE_RE = re.compile(
+    rb'^[^\n]*?(?:(?P<started>' + re.escape(EVENT_EVALUATION_STARTED) + rb')'
+    rb'|(?P<succeeded>' + re.escape(EVENT_EVALUATION_SUCCEEDED) + rb')'
+    rb'|(?P<intensive>' + re.escape(EVENT_INTENSIVE_STARTED) + rb')'
+    rb'|(?P<rest>' + re.escape(EVENT_REST_STARTED) + rb'))'
+    rb'|(?P<failed>^(?=[^\n]*evaluation)[^\n]*failed)',
+    re.MULTILINE
+)
+_CYCLE_RE = re.compile(r'\[CYCLE (\d+)\]')
+
+def draw_frame(frame):
+    """Repaint the terminal in place with a single write instead of clearing it"""
+    sys.stdout.write(f"{CURSOR_HOME}{frame}{CLEAR_TO_END}")
+    sys.stdout.flush()
 
 def get_simulator_status():
     """Check if simulator is running and get basic info"""
     try:
-        result = subprocess.run(['pgrep', '-f', 'real_world_simulator.py'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            pid = result.stdout.strip()
-            return {"running": True, "pid": pid}
+        pids = find_pids('real_world_simulator.py')
+        if pids:
+            return {"running": True, "pid": ", ".join(pids)}
         else:
             return {"running": False, "pid": None}
     except Exception:
         return {"running": False, "pid": None}
 
-def parse_log_file():
-    """Parse the simulator log file for current status"""
-    log_file = "automation/real_world_simulator.log"
-    
-    if not os.path.exists(log_file):
+def parse_log_timestamp(line):
+    """Parse the timestamp prefix of a log line, or return None"""
+    match = _LOG_RE.match(line)
+    if not match:
         return None
-    
+    # The asctime prefix is fixed-width, so slice it instead of using strptime
     try:
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-        
-        # Parse log for current phase, cycle, and stats
-        current_phase = "unknown"
-        cycle_count = 0
-        total_evaluations = 0
-        successful_evaluations = 0
-        failed_evaluations = 0
-        last_evaluation_time = None
-        phase_start_time = None
+        return datetime(
+            int(line[0:4]), int(line[5:7]), int(line[8:10]),
+            int(line[11:13]), int(line[14:16]), int(line[17:19]), int(line[20:23]) * 1000
+        )
+    except ValueError:
+        return None
+
+def line_at(data, pos):
+    """Decode the line of a log buffer that contains byte offset pos"""
+    start = data.rfind(b'\n', 0, pos) + 1
+    end = data.find(b'\n', pos)
+    return data[start:end if end >= 0 else len(data)].decode('utf-8', errors='replace')
+
+class LogTailer:
+    """Incrementally parse the simulator log, reading only lines appended since the last poll"""
+    
+    # Fields persisted between dashboard runs
+    STATE_FIELDS = (
+        "inode", "offset", "current_phase", "total_evaluations", "successful_evaluations",
+        "failed_evaluations", "cycle_count", "phase_start_time", "last_evaluation_time"
+    )
+    TIME_FIELDS = ("phase_start_time", "last_evaluation_time")
+    
+    def __init__(self, log_file, state_file=None):
+        self.log_file = log_file
+        self.state_file = state_file
+        self.reset()
+        self.load_state()
+    
+    def reset(self):
+        """Forget the read position and all counters"""
+        self.inode = None
+        self.offset = 0
+        self.current_phase = "unknown"
+        self.total_evaluations = 0
+        self.successful_evaluations = 0
+        self.failed_evaluations = 0
+        self.cycle_count = 0
+        self.phase_start_time = None
+        self.last_evaluation_time = None
+    
+    def poll(self):
+        """Read newly appended log lines and return the current status"""
+        try:
+            stat = os.stat(self.log_file)
+        except FileNotFoundError:
+            return None
         
-        for line in reversed(lines):  # Start from most recent
-            if "Starting INTENSIVE phase" in line:
-                current_phase = "intensive"
-                if not phase_start_time:
-                    # Extract timestamp
-                    timestamp_str = line.split(' - ')[0]
-                    try:
-                        phase_start_time = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S,%f')
-                    except:
-                        pass
-                # Extract cycle number
-                if "[CYCLE" in line:
-                    try:
-                        cycle_part = line.split("[CYCLE ")[1].split("]")[0]
-                        cycle_count = int(cycle_part)
-                    except:
-                        pass
-                break
-            elif "Switching to REST phase" in line:
-                current_phase = "rest"
-                if not phase_start_time:
-                    timestamp_str = line.split(' - ')[0]
-                    try:
-                        phase_start_time = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S,%f')
-                    except:
-                        pass
-                break
+        try:
+            # Start over if the log was replaced or truncated
+            if stat.st_ino != self.inode or stat.st_size < self.offset:
+                self.reset()
+                self.inode = stat.st_ino
+            
+            if stat.st_size > self.offset:
+                self.read_appended()
+                self.save_state()
+            
+            return self.snapshot()
         
-        # Count evaluations
-        for line in lines:
-            if "Starting evaluation #" in line:
-                total_evaluations += 1
-            elif "completed successfully" in line:
-                successful_evaluations += 1
-            elif "failed" in line and "evaluation" in line:
-                failed_evaluations += 1
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def load_state(self):
+        """Resume from saved state if it still matches the log file"""
+        if not self.state_file:
+            return
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+            stat = os.stat(self.log_file)
+            if state["inode"] != stat.st_ino or state["offset"] > stat.st_size:
+                return
+            for field in self.TIME_FIELDS:
+                if state[field]:
+                    state[field] = datetime.fromisoformat(state[field])
+            for field in self.STATE_FIELDS:
+                setattr(self, field, state[field])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.reset()
+    
+    def save_state(self):
+        """Atomically persist the read position and counters"""
+        if not self.state_file:
+            return
+        state = {field: getattr(self, field) for field in self.STATE_FIELDS}
+        for field in self.TIME_FIELDS:
+            if state[field]:
+                state[field] = state[field].isoformat()
+        temp_file = f"{self.state_file}.tmp"
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(state, f)
+            os.replace(temp_file, self.state_file)
+        except OSError:
+            pass
+    
+    def read_appended(self):
+        """Parse appended log data in bounded blocks so memory stays O(block)"""
+        with open(self.log_file, 'rb') as f:
+            f.seek(self.offset)
+            pending = b''
+            while True:
+                block = f.read(READ_BLOCK_SIZE)
+                if not block:
+                    break
+                pending += block
+                # Leave a partially written last line for the next block or poll
+                end = pending.rfind(b'\n') + 1
+                if end:
+                    self.feed(pending[:end])
+                    self.offset += end
+                    pending = pending[end:]
+    
+    def feed(self, data):
+        """Update the counters and phase state from a buffer of complete log lines"""
+        # One regex sweep classifies every event line of the buffer
+        last_evaluation = last_phase = None
+        for match in _EVENT_LINE_RE.finditer(data):
+            event = match.lastgroup
+            if event == "started":
+                self.total_evaluations += 1
+                last_evaluation = match.start()
+            elif event == "succeeded":
+                self.successful_evaluations += 1
+            elif event == "failed":
+                self.failed_evaluations += 1
+            else:
+                last_phase = match
         
-        # Get last evaluation time
-        for line in reversed(lines):
-            if "Starting evaluation #" in line:
-                timestamp_str = line.split(' - ')[0]
-                try:
-                    last_evaluation_time = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S,%f')
-                except:
-                    pass
-                break
+        if last_evaluation is not None:
+            self.last_evaluation_time = parse_log_timestamp(line_at(data, last_evaluation))
         
+        # Track the most recent phase transition
+        if last_phase is not None:
+            phase_line = line_at(data, last_phase.start())
+            if last_phase.lastgroup == "intensive":
+                cycle_match = _CYCLE_RE.search(phase_line)
+                self.current_phase = "intensive"
+                self.cycle_count = int(cycle_match.group(1)) if cycle_match else 0
+            else:
+                self.current_phase = "rest"
+                self.cycle_count = 0
+            self.phase_start_time = parse_log_timestamp(phase_line)
+    
+    def snapshot(self):
+        """Build the status dict from the accumulated state"""
         return {
-            "current_phase": current_phase,
-            "cycle_count": cycle_count,
-            "total_evaluations": total_evaluations,
-            "successful_evaluations": successful_evaluations,
-            "failed_evaluations": failed_evaluations,
-            "last_evaluation_time": last_evaluation_time,
-            "phase_start_time": phase_start_time
+            "current_phase": self.current_phase,
+            "cycle_count": self.cycle_count,
+            "total_evaluations": self.total_evaluations,
+            "successful_evaluations": self.successful_evaluations,
+            "failed_evaluations": self.failed_evaluations,
+            "last_evaluation_time": self.last_evaluation_time,
+            "phase_start_time": self.phase_start_time
         }
-        
-    except Exception as e:
-        return {"error": str(e)}
 
-def calculate_phase_progress(phase_start_time, current_phase):
+_log_tailer = LogTailer(LOG_FILE, STATE_FILE)
+
+def parse_log_file():
+    """Parse the simulator log file for current status"""
+    return _log_tailer.poll()
+
+def create_log_watcher():
+    """Watch the simulator log directory with inotify, or return None if unavailable"""
+    if not INOTIFY_AVAILABLE:
+        return None
+    try:
+        watcher = INotify()
+        watcher.add_watch(os.path.dirname(LOG_FILE), flags.MODIFY | flags.CREATE | flags.MOVED_TO)
+        return watcher
+    except OSError:
+        return None
+
+def wait_for_log_change(watcher, timeout):
+    """Block until the simulator log changes or timeout seconds have passed"""
+    if watcher is None:
+        time.sleep(timeout)
+        return
+    
+    log_name = os.path.basename(LOG_FILE)
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        # Short read delay batches bursts of log writes into one redraw
+        for event in watcher.read(timeout=int(remaining * 1000), read_delay=100):
+            if event.name == log_name:
+                return
+
+def calculate_phase_progress(phase_start_time, current_phase, now):
     """Calculate progress within current phase"""
     if not phase_start_time:
         return 0, timedelta(0), timedelta(0)
     
-    now = datetime.now()
     elapsed = now - phase_start_time
     
     if current_phase == "intensive":
@@ -142,112 +297,129 @@ def format_timedelta(td):
     minutes, seconds = divmod(remainder, 60)
     return f"{hours}:{minutes:02d}:{seconds:02d}"
 
+# Prebuilt progress bar strings, sliced to the needed width
+_BAR_FILLED = "█" * 80
+_BAR_EMPTY = "░" * 80
+
 def create_progress_bar(progress, width=40):
     """Create a text progress bar"""
     filled = int(width * progress / 100)
-    bar = "█" * filled + "░" * (width - filled)
-    return f"[{bar}] {progress:.1f}%"
+    if width > len(_BAR_FILLED):
+        return f"[{'█' * filled}{'░' * (width - filled)}] {progress:.1f}%"
+    return f"[{_BAR_FILLED[:filled]}{_BAR_EMPTY[:width - filled]}] {progress:.1f}%"
+
+def join_frame(parts):
+    """Join frame lines, clearing the rest of each line so shorter text leaves no stale characters"""
+    return "".join(f"{part}{CLEAR_LINE}\n" for part in parts)
+
+def render_frame(status, log_status, now):
+    """Render one dashboard frame as a single string"""
+    parts = []
+    parts.append("🌍 REAL-WORLD LLM USAGE SIMULATOR DASHBOARD")
+    parts.append("=" * 60)
+    parts.append(f"🕐 Current Time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    parts.append("")
+    
+    if not status["running"]:
+        parts.append("❌ SIMULATOR NOT RUNNING")
+        parts.append("")
+        parts.append("Start with: automation/run_real_world_sim.sh start")
+        parts.append("Press Ctrl+C to exit dashboard")
+        return join_frame(parts)
+    
+    parts.append(f"✅ SIMULATOR RUNNING (PID: {status['pid']})")
+    parts.append("")
+    
+    if log_status and "error" not in log_status:
+        # Current Phase
+        phase = log_status["current_phase"].upper()
+        if phase == "INTENSIVE":
+            phase_emoji = "⚡"
+            phase_color = "\033[92m"  # Green
+        else:
+            phase_emoji = "😴"
+            phase_color = "\033[94m"  # Blue
+        
+        parts.append(f"{phase_emoji} CURRENT PHASE: {phase_color}{phase}\033[0m")
+        
+        # Phase Progress, computed once per frame from the frame's timestamp
+        progress, elapsed, remaining = calculate_phase_progress(
+            log_status["phase_start_time"], 
+            log_status["current_phase"],
+            now
+        )
+        if log_status["phase_start_time"]:
+            parts.append(f"📊 Progress: {create_progress_bar(progress)}")
+            parts.append(f"⏱️  Elapsed: {format_timedelta(elapsed)}")
+            parts.append(f"⏳ Remaining: {format_timedelta(remaining)}")
+        
+        parts.append("")
+        
+        # Cycle Information
+        parts.append(f"🔄 CYCLE: {log_status['cycle_count']}")
+        
+        # Statistics
+        total = log_status["total_evaluations"]
+        success = log_status["successful_evaluations"]
+        failed = log_status["failed_evaluations"]
+        success_rate = (success / total * 100) if total > 0 else 0
+        
+        parts.append(f"📈 STATISTICS:")
+        parts.append(f"   Total Evaluations: {total}")
+        parts.append(f"   ✅ Successful: {success}")
+        parts.append(f"   ❌ Failed: {failed}")
+        parts.append(f"   🎯 Success Rate: {success_rate:.1f}%")
+        
+        # Last Evaluation
+        if log_status["last_evaluation_time"]:
+            last_eval_ago = now - log_status["last_evaluation_time"]
+            parts.append(f"   🕐 Last Evaluation: {format_timedelta(last_eval_ago)} ago")
+        
+        parts.append("")
+        
+        # Next Action
+        if log_status["current_phase"] == "intensive":
+            parts.append("🔜 NEXT: Evaluation in ~1 minute")
+        else:
+            if remaining.total_seconds() > 0:
+                parts.append(f"🔜 NEXT: Intensive phase in {format_timedelta(remaining)}")
+            else:
+                parts.append("🔜 NEXT: Starting intensive phase...")
+        
+    else:
+        parts.append("⚠️  Could not parse log file")
+        if log_status and "error" in log_status:
+            parts.append(f"Error: {log_status['error']}")
+    
+    parts.append("")
+    parts.append("─" * 60)
+    parts.append("📋 Commands:")
+    parts.append("   automation/run_real_world_sim.sh status")
+    parts.append("   automation/run_real_world_sim.sh logs")
+    parts.append("   automation/run_real_world_sim.sh stop")
+    parts.append("")
+    parts.append("Press Ctrl+C to exit dashboard")
+    
+    return join_frame(parts)
 
 def display_dashboard():
     """Display the main dashboard"""
+    watcher = create_log_watcher()
     while True:
-        clear_screen()
-        
-        print("🌍 REAL-WORLD LLM USAGE SIMULATOR DASHBOARD")
-        print("=" * 60)
-        print(f"🕐 Current Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
-        
-        # Check if simulator is running
+        now = datetime.now()
         status = get_simulator_status()
         
         if not status["running"]:
-            print("❌ SIMULATOR NOT RUNNING")
-            print()
-            print("Start with: automation/run_real_world_sim.sh start")
-            print("Press Ctrl+C to exit dashboard")
+            draw_frame(render_frame(status, None, now))
             time.sleep(5)
             continue
         
-        print(f"✅ SIMULATOR RUNNING (PID: {status['pid']})")
-        print()
-        
         # Parse log file for detailed status
-        log_status = parse_log_file()
-        
-        if log_status and "error" not in log_status:
-            # Current Phase
-            phase = log_status["current_phase"].upper()
-            if phase == "INTENSIVE":
-                phase_emoji = "⚡"
-                phase_color = "\033[92m"  # Green
-            else:
-                phase_emoji = "😴"
-                phase_color = "\033[94m"  # Blue
-            
-            print(f"{phase_emoji} CURRENT PHASE: {phase_color}{phase}\033[0m")
-            
-            # Phase Progress
-            if log_status["phase_start_time"]:
-                progress, elapsed, remaining = calculate_phase_progress(
-                    log_status["phase_start_time"], 
-                    log_status["current_phase"]
-                )
-                
-                print(f"📊 Progress: {create_progress_bar(progress)}")
-                print(f"⏱️  Elapsed: {format_timedelta(elapsed)}")
-                print(f"⏳ Remaining: {format_timedelta(remaining)}")
-            
-            print()
-            
-            # Cycle Information
-            print(f"🔄 CYCLE: {log_status['cycle_count']}")
-            
-            # Statistics
-            total = log_status["total_evaluations"]
-            success = log_status["successful_evaluations"]
-            failed = log_status["failed_evaluations"]
-            success_rate = (success / total * 100) if total > 0 else 0
-            
-            print(f"📈 STATISTICS:")
-            print(f"   Total Evaluations: {total}")
-            print(f"   ✅ Successful: {success}")
-            print(f"   ❌ Failed: {failed}")
-            print(f"   🎯 Success Rate: {success_rate:.1f}%")
-            
-            # Last Evaluation
-            if log_status["last_evaluation_time"]:
-                last_eval_ago = datetime.now() - log_status["last_evaluation_time"]
-                print(f"   🕐 Last Evaluation: {format_timedelta(last_eval_ago)} ago")
-            
-            print()
-            
-            # Next Action
-            if log_status["current_phase"] == "intensive":
-                print("🔜 NEXT: Evaluation in ~1 minute")
-            else:
-                if remaining.total_seconds() > 0:
-                    print(f"🔜 NEXT: Intensive phase in {format_timedelta(remaining)}")
-                else:
-                    print("🔜 NEXT: Starting intensive phase...")
-            
-        else:
-            print("⚠️  Could not parse log file")
-            if log_status and "error" in log_status:
-                print(f"Error: {log_status['error']}")
-        
-        print()
-        print("─" * 60)
-        print("📋 Commands:")
-        print("   automation/run_real_world_sim.sh status")
-        print("   automation/run_real_world_sim.sh logs")
-        print("   automation/run_real_world_sim.sh stop")
-        print()
-        print("Press Ctrl+C to exit dashboard")
+        draw_frame(render_frame(status, parse_log_file(), now))
         
-        # Wait 10 seconds before refresh
+        # Wait for new log output, refreshing at least every REFRESH_SECONDS
         try:
-            time.sleep(10)
+            wait_for_log_change(watcher, REFRESH_SECONDS)
         except KeyboardInterrupt:
             print("\n👋 Dashboard closed")
             break
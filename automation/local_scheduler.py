@@ -8,18 +8,25 @@ and upload results to GCS. Designed for local development and testing.
 
 import os
 import sys
-import time
 import subprocess
+import threading
 import schedule
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
 import signal
 import json
+import re
+from collections import deque
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+# Batch evaluator output lines worth copying into the scheduler log
+KEY_OUTPUT_RE = re.compile(r'Uploaded|records saved|Success:|Error')
+# Output lines kept for reporting a failed run
+OUTPUT_TAIL_LINES = 50
+
 class LocalBatchScheduler:
     """Local scheduler for batch evaluator with GCS upload"""
     
@@ -39,6 +46,7 @@ class LocalBatchScheduler:
         self.log_file = log_file
         self.max_runtime_minutes = max_runtime_minutes
         self.running = True
+        self._stop_event = threading.Event()
         self.execution_count = 0
         self.setup_logging()
         
@@ -66,33 +74,57 @@ class LocalBatchScheduler:
         self.logger.info(f"Start time: {start_time}")
         
         try:
-            # Run the batch evaluator
-            result = subprocess.run([
-                sys.executable, self.evaluation_script
-            ], 
-            capture_output=True, 
-            text=True, 
-            timeout=self.max_runtime_minutes * 60,
-            cwd=os.path.dirname(os.path.dirname(__file__))
+            # Run the batch evaluator, streaming its output instead of buffering it
+            command = [sys.executable, self.evaluation_script]
+            timeout_seconds = self.max_runtime_minutes * 60
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                cwd=os.path.dirname(os.path.dirname(__file__))
             )
             
+            timed_out = threading.Event()
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
+            timer = threading.Timer(timeout_seconds, kill_on_timeout)
+            timer.start()
+            
+            key_lines = []
+            recent_output = deque(maxlen=OUTPUT_TAIL_LINES)
+            try:
+                for line in process.stdout:
+                    line = line.rstrip('\n')
+                    recent_output.append(line)
+                    if KEY_OUTPUT_RE.search(line):
+                        key_lines.append(line)
+                returncode = process.wait()
+            finally:
+                timer.cancel()
+                process.stdout.close()
+            
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(command, timeout_seconds)
+            
             end_time = datetime.now()
             duration = end_time - start_time
             
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info(f"✅ Batch evaluation #{self.execution_count} completed successfully")
                 self.logger.info(f"Duration: {duration}")
                 
                 # Log key output lines
-                output_lines = result.stdout.split('\n')
-                for line in output_lines:
-                    if any(keyword in line for keyword in ['Uploaded', 'records saved', 'Success:', 'Error']):
-                        self.logger.info(f"   {line}")
+                for line in key_lines:
+                    self.logger.info(f"   {line}")
                         
             else:
+                output_tail = '\n'.join(recent_output)
                 self.logger.error(f"❌ Batch evaluation #{self.execution_count} failed")
-                self.logger.error(f"Return code: {result.returncode}")
-                self.logger.error(f"STDERR: {result.stderr}")
+                self.logger.error(f"Return code: {returncode}")
+                self.logger.error(f"Output (last {OUTPUT_TAIL_LINES} lines): {output_tail}")
                 
         except subprocess.TimeoutExpired:
             self.logger.error(f"⏰ Batch evaluation #{self.execution_count} timed out after {self.max_runtime_minutes} minutes")
@@ -161,8 +193,15 @@ class LocalBatchScheduler:
                 if hasattr(self, 'end_time') and datetime.now() > self.end_time:
                     self.logger.info("⏰ Evaluation period completed")
                     break
-                    
-                time.sleep(30)  # Check every 30 seconds
+                
+                # Sleep until the next job is due (or the period ends);
+                # stop_scheduler() wakes the wait early
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is None:
+                    idle_seconds = 30
+                if hasattr(self, 'end_time'):
+                    idle_seconds = min(idle_seconds, (self.end_time - datetime.now()).total_seconds())
+                self._stop_event.wait(max(idle_seconds, 0))
                 
         except KeyboardInterrupt:
             self.logger.info("⚠️ Received keyboard interrupt")
@@ -172,6 +211,7 @@ class LocalBatchScheduler:
     def stop_scheduler(self):
         """Stop the scheduler"""
         self.running = False
+        self._stop_event.set()
         self.logger.info("🛑 Scheduler stopped")
         self.logger.info(f"📊 Total evaluations completed: {self.execution_count}")
         
@@ -8,12 +8,63 @@ Monitor the status of automated batch evaluations and view logs.
 import os
 import sys
 import json
+import mmap
+import functools
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext, ExitStack
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from automation.process_lookup import find_pids
+
+@contextmanager
+def map_log(path):
+    """Memory-map a log file read-only (empty files, which cannot be mapped, yield b'')"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+                yield log_map
+
+def tail_lines(buffer, n):
+    """Return the last n lines of a bytes-like buffer such as an mmap, scanning back from the end"""
+    end = len(buffer)
+    if n <= 0 or end == 0:
+        return []
+    if end and buffer[end - 1:end] == b'\n':
+        end -= 1
+    start = end
+    for _ in range(n):
+        newline = buffer.rfind(b'\n', 0, start)
+        if newline == -1:
+            start = 0
+            break
+        start = newline
+    else:
+        start += 1
+    return [line.decode('utf-8', errors='replace') for line in buffer[start:end].split(b'\n')]
+
+def count_occurrences(buffer, needle):
+    """Count non-overlapping occurrences of needle in a bytes-like buffer such as an mmap"""
+    count = 0
+    position = buffer.find(needle)
+    while position != -1:
+        count += 1
+        position = buffer.find(needle, position + len(needle))
+    return count
+
+@functools.lru_cache(maxsize=1)
+def get_gcs_client():
+    """Import google.cloud.storage and create the client once per process"""
+    from google.cloud import storage
+    return storage.Client()
+
 class BatchEvaluatorMonitor:
     """Monitor for batch evaluator automation"""
     
@@ -21,152 +72,162 @@ class BatchEvaluatorMonitor:
         self.project_root = Path(os.path.dirname(os.path.dirname(__file__)))
         self.log_file = self.project_root / "automation" / "batch_scheduler.log"
         self.data_dir = self.project_root / "data"
+        # Per-thread output buffer used while checks run concurrently
+        self._output = threading.local()
+        
+    def emit(self, *args):
+        """Print check output, into the calling thread's buffer when one is active"""
+        print(*args, file=getattr(self._output, "buffer", None) or sys.stdout)
+    
+    def _run_buffered(self, check, *args):
+        """Run a check with its output captured so it can be printed in order"""
+        self._output.buffer = io.StringIO()
+        try:
+            check(*args)
+            return self._output.buffer.getvalue()
+        finally:
+            self._output.buffer = None
         
     def check_gcs_status(self):
         """Check GCS upload status"""
-        print("🔍 Checking GCS Status...")
+        self.emit("🔍 Checking GCS Status...")
         try:
-            from google.cloud import storage
-            from automation.local_scheduler import LocalBatchScheduler
-            
-            # Set up credentials like the scheduler does
-            scheduler = LocalBatchScheduler()
-            
             # Check environment variables
             gcp_creds = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
             gcs_bucket = os.environ.get('GCS_BUCKET', 'llm-evaluation-data')
             
             if not gcp_creds:
-                print("⚠️  GOOGLE_APPLICATION_CREDENTIALS not set")
+                self.emit("⚠️  GOOGLE_APPLICATION_CREDENTIALS not set")
                 return False
                 
-            # Test GCS connection
-            client = storage.Client()
-            bucket = client.bucket(gcs_bucket)
-            
-            if not bucket.exists():
-                print(f"❌ Bucket {gcs_bucket} does not exist")
-                return False
+            # Fetch both metrics files and their metadata in a single list request
+            try:
+                blobs = {
+                    blob.name: blob
+                    for blob in get_gcs_client().list_blobs(gcs_bucket, prefix="batch_eval_metrics.")
+                }
+            except Exception as e:
+                if getattr(e, "code", None) == 404:
+                    self.emit(f"❌ Bucket {gcs_bucket} does not exist")
+                    return False
+                raise
                 
             # Check for recent files
-            json_blob = bucket.blob("batch_eval_metrics.json")
-            csv_blob = bucket.blob("batch_eval_metrics.csv")
+            json_blob = blobs.get("batch_eval_metrics.jsonl")
+            csv_blob = blobs.get("batch_eval_metrics.csv")
             
-            if json_blob.exists() and csv_blob.exists():
-                print(f"✅ GCS bucket: {gcs_bucket}")
-                print(f"   JSON: {json_blob.size} bytes, updated: {json_blob.updated}")
-                print(f"   CSV: {csv_blob.size} bytes, updated: {csv_blob.updated}")
+            if json_blob and csv_blob:
+                self.emit(f"✅ GCS bucket: {gcs_bucket}")
+                self.emit(f"   JSON: {json_blob.size} bytes, updated: {json_blob.updated}")
+                self.emit(f"   CSV: {csv_blob.size} bytes, updated: {csv_blob.updated}")
                 return True
             else:
-                print(f"⚠️  Files missing in bucket {gcs_bucket}")
+                self.emit(f"⚠️  Files missing in bucket {gcs_bucket}")
                 return False
                 
         except Exception as e:
-            print(f"❌ GCS check failed: {e}")
+            self.emit(f"❌ GCS check failed: {e}")
             return False
     
     def check_local_files(self):
         """Check local data files"""
-        print("\n📁 Checking Local Files...")
+        self.emit("\n📁 Checking Local Files...")
         
-        json_file = self.data_dir / "batch_eval_metrics.json"
+        json_file = self.data_dir / "batch_eval_metrics.jsonl"
         csv_file = self.data_dir / "batch_eval_metrics.csv"
         
         if json_file.exists():
             size = json_file.stat().st_size
             modified = datetime.fromtimestamp(json_file.stat().st_mtime)
-            print(f"✅ JSON: {size} bytes, modified: {modified}")
+            self.emit(f"✅ JSON: {size} bytes, modified: {modified}")
         else:
-            print("❌ JSON file not found")
+            self.emit("❌ JSON file not found")
             
         if csv_file.exists():
             size = csv_file.stat().st_size
             modified = datetime.fromtimestamp(csv_file.stat().st_mtime)
-            print(f"✅ CSV: {size} bytes, modified: {modified}")
+            self.emit(f"✅ CSV: {size} bytes, modified: {modified}")
         else:
-            print("❌ CSV file not found")
+            self.emit("❌ CSV file not found")
+    
+    def open_log(self, log_map=None):
+        """Map the scheduler log, or reuse a map shared by the caller"""
+        return nullcontext(log_map) if log_map is not None else map_log(self.log_file)
     
-    def view_recent_logs(self, lines: int = 20):
+    def view_recent_logs(self, lines: int = 20, log_map=None):
         """View recent log entries"""
-        print(f"\n📋 Recent Log Entries (last {lines} lines)...")
+        self.emit(f"\n📋 Recent Log Entries (last {lines} lines)...")
         
         if not self.log_file.exists():
-            print("❌ Log file not found")
+            self.emit("❌ Log file not found")
             return
             
         try:
-            with open(self.log_file, 'r') as f:
-                log_lines = f.readlines()
-                
             # Show last N lines
-            recent_lines = log_lines[-lines:] if len(log_lines) > lines else log_lines
+            with self.open_log(log_map) as log_data:
+                recent_lines = tail_lines(log_data, lines)
             
             for line in recent_lines:
                 line = line.strip()
                 if line:
                     # Color code log levels
                     if "ERROR" in line:
-                        print(f"\033[0;31m{line}\033[0m")  # Red
+                        self.emit(f"\033[0;31m{line}\033[0m")  # Red
                     elif "WARNING" in line or "WARN" in line:
-                        print(f"\033[0;33m{line}\033[0m")  # Yellow
+                        self.emit(f"\033[0;33m{line}\033[0m")  # Yellow
                     elif "✅" in line or "SUCCESS" in line:
-                        print(f"\033[0;32m{line}\033[0m")  # Green
+                        self.emit(f"\033[0;32m{line}\033[0m")  # Green
                     else:
-                        print(line)
+                        self.emit(line)
                         
         except Exception as e:
-            print(f"❌ Error reading log file: {e}")
+            self.emit(f"❌ Error reading log file: {e}")
     
-    def get_evaluation_stats(self):
+    def get_evaluation_stats(self, log_map=None):
         """Get evaluation statistics from logs"""
-        print("\n📊 Evaluation Statistics...")
+        self.emit("\n📊 Evaluation Statistics...")
         
         if not self.log_file.exists():
-            print("❌ Log file not found")
+            self.emit("❌ Log file not found")
             return
             
         try:
-            with open(self.log_file, 'r') as f:
-                log_content = f.read()
-                
-            # Count evaluations
-            completed_count = log_content.count("completed successfully")
-            failed_count = log_content.count("failed")
-            timeout_count = log_content.count("timed out")
+            # Count evaluations over a memory map instead of a decoded copy of the log
+            with self.open_log(log_map) as log_data:
+                completed_count = count_occurrences(log_data, b"completed successfully")
+                failed_count = count_occurrences(log_data, b"failed")
+                timeout_count = count_occurrences(log_data, b"timed out")
             
-            print(f"✅ Completed: {completed_count}")
-            print(f"❌ Failed: {failed_count}")
-            print(f"⏰ Timeouts: {timeout_count}")
-            print(f"📈 Total attempts: {completed_count + failed_count + timeout_count}")
+            self.emit(f"✅ Completed: {completed_count}")
+            self.emit(f"❌ Failed: {failed_count}")
+            self.emit(f"⏰ Timeouts: {timeout_count}")
+            self.emit(f"📈 Total attempts: {completed_count + failed_count + timeout_count}")
             
             # Success rate
             total = completed_count + failed_count + timeout_count
             if total > 0:
                 success_rate = (completed_count / total) * 100
-                print(f"🎯 Success rate: {success_rate:.1f}%")
+                self.emit(f"🎯 Success rate: {success_rate:.1f}%")
                 
         except Exception as e:
-            print(f"❌ Error analyzing logs: {e}")
+            self.emit(f"❌ Error analyzing logs: {e}")
     
     def check_scheduler_process(self):
         """Check if scheduler is running"""
-        print("\n🔍 Checking Scheduler Process...")
+        self.emit("\n🔍 Checking Scheduler Process...")
         
-        import subprocess
         try:
-            result = subprocess.run(['pgrep', '-f', 'local_scheduler.py'], 
-                                  capture_output=True, text=True)
+            pids = find_pids('local_scheduler.py')
             
-            if result.returncode == 0:
-                pids = result.stdout.strip().split('\n')
-                print(f"✅ Scheduler running (PIDs: {', '.join(pids)})")
+            if pids:
+                self.emit(f"✅ Scheduler running (PIDs: {', '.join(pids)})")
                 return True
             else:
-                print("❌ Scheduler not running")
+                self.emit("❌ Scheduler not running")
                 return False
                 
         except Exception as e:
-            print(f"⚠️  Could not check process: {e}")
+            self.emit(f"⚠️  Could not check process: {e}")
             return False
     
     def full_status_report(self):
@@ -174,11 +235,22 @@ class BatchEvaluatorMonitor:
         print("🏥 Batch Evaluator Health Check")
         print("=" * 50)
         
-        self.check_scheduler_process()
-        self.check_local_files()
-        self.check_gcs_status()
-        self.get_evaluation_stats()
-        self.view_recent_logs(10)
+        # The checks are independent and I/O-bound (the GCS round-trip dominates),
+        # so run them concurrently and print their output in report order
+        # Map the log once for both the statistics and the recent entries
+        with ExitStack() as stack:
+            log_map = stack.enter_context(map_log(self.log_file)) if self.log_file.exists() else None
+            checks = [
+                (self.check_scheduler_process,),
+                (self.check_local_files,),
+                (self.check_gcs_status,),
+                (self.get_evaluation_stats, log_map),
+                (self.view_recent_logs, 10, log_map),
+            ]
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = [executor.submit(self._run_buffered, *check) for check in checks]
+                for future in futures:
+                    sys.stdout.write(future.result())
 
 
 def main():
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Process Lookup for Automation Tools
+
+Finds running automation processes by scanning /proc directly instead of
+forking pgrep on every check. Falls back to pgrep where /proc is unavailable.
+"""
+
+import os
+import time
+import subprocess
+
+# Seconds to trust a previous scan before scanning again
+PID_CACHE_SECONDS = 5
+
+_pid_cache = {}
+
+def _cmdline_matches(pid, needle):
+    """Check whether a process command line contains needle"""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return needle in f.read().replace(b"\0", b" ")
+    except OSError:
+        return False
+
+def _scan_pids(pattern):
+    """Scan the process table for command lines containing pattern"""
+    if not os.path.isdir("/proc"):
+        result = subprocess.run(['pgrep', '-f', pattern], capture_output=True, text=True)
+        return tuple(result.stdout.split()) if result.returncode == 0 else ()
+
+    needle = pattern.encode()
+    own_pid = os.getpid()
+    return tuple(
+        str(pid) for pid in sorted(int(entry) for entry in os.listdir("/proc") if entry.isdigit())
+        if pid != own_pid and _cmdline_matches(pid, needle)
+    )
+
+def find_pids(pattern):
+    """
+    Find processes whose command line contains pattern, like pgrep -f.
+
+    A scan is reused for up to PID_CACHE_SECONDS while its processes are
+    still alive, so repeated checks cost one small /proc read per PID; after
+    that the process table is scanned again to pick up newly started matches.
+
+    Returns:
+        Tuple of matching PIDs as strings
+    """
+    now = time.monotonic()
+    cached = _pid_cache.get(pattern)
+    if cached and os.path.isdir("/proc"):
+        pids, checked_at = cached
+        if now - checked_at < PID_CACHE_SECONDS:
+            needle = pattern.encode()
+            if all(_cmdline_matches(pid, needle) for pid in pids):
+                return pids
+
+    pids = _scan_pids(pattern)
+    _pid_cache[pattern] = (pids, now)
+    return pids
@@ -13,10 +13,20 @@ import sys
 import time
 import subprocess
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime, timedelta, time as dtime
 from typing import Optional
+import re
 import signal
-import json
+import selectors
+import ctypes
+import threading
+from collections import deque
+import importlib.util
+import traceback
+import tempfile
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -24,15 +34,89 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 ACTIVE_START = dtime(9, 0)   # 9:00 AM
 ACTIVE_END = dtime(17, 0)    # 5:00 PM
 
+# Simulator log rotation: size of each file and number of rotated files kept
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+# Seconds between the starts of consecutive evaluations in active hours
+EVALUATION_INTERVAL_SECONDS = 30
+# Evaluator output lines worth copying into the simulator log
+# Matched against raw bytes so only the lines that get logged are decoded
+KEY_OUTPUT_RE = re.compile(rb'Uploaded|records saved|Success:|Error')
+# The same lines in the in-process evaluator's text output
+KEY_OUTPUT_TEXT_RE = re.compile(KEY_OUTPUT_RE.pattern.decode('ascii'))
+# In-process evaluator output kept in memory before spilling to a temp file
+OUTPUT_SPOOL_BYTES = 1024 * 1024
+# Evaluator output lines kept for the failure report
+OUTPUT_TAIL_LINES = 50
+
+@contextmanager
+def working_directory(path):
+    """Temporarily change the working directory (contextlib.chdir before 3.11)"""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+class EvaluationTimeout(BaseException):
+    """Raised on the main thread when an in-process evaluation runs too long"""
+
+# Linux timerfd through libc, so long sleeps end at a wall-clock time even
+# across suspend/resume or clock changes
+CLOCK_REALTIME = 0
+TFD_TIMER_ABSTIME = 1
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _Timespec), ("it_value", _Timespec)]
+
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _libc.timerfd_create
+    _libc.timerfd_settime
+    TIMERFD_AVAILABLE = True
+except (OSError, AttributeError):
+    TIMERFD_AVAILABLE = False
+
+def create_timerfd():
+    """Create a non-blocking CLOCK_REALTIME timerfd, or None if unsupported"""
+    if not TIMERFD_AVAILABLE:
+        return None
+    fd = _libc.timerfd_create(CLOCK_REALTIME, os.O_NONBLOCK | os.O_CLOEXEC)
+    return fd if fd >= 0 else None
+
+def set_timerfd(fd, timestamp):
+    """Arm fd to fire at an absolute epoch timestamp; 0 disarms it"""
+    seconds = int(timestamp)
+    spec = _Itimerspec(it_value=_Timespec(seconds, int((timestamp - seconds) * 1e9)))
+    if _libc.timerfd_settime(fd, TFD_TIMER_ABSTIME, ctypes.byref(spec), None) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+
+def drain_fd(fd):
+    """Read everything pending on a non-blocking fd"""
+    try:
+        while os.read(fd, 512):
+            pass
+    except BlockingIOError:
+        pass
+
 class RealWorldSimulator:
     """Real-world usage pattern simulator for batch evaluator"""
+
+    # Log directories already created by this process
+    _dirs_created = set()
     
     def __init__(self, 
                  evaluation_script: str = "batch_evaluator.py",
                  log_file: str = "automation/real_world_simulator.log",
                  max_runtime_minutes: int = 10,
                  intensive_duration_hours: int = 3,
-                 rest_duration_minutes: int = 10):
+                 rest_duration_minutes: int = 10,
+                 in_process: bool = False):
         """
         Initialize the real-world simulator
         
@@ -42,36 +126,178 @@ class RealWorldSimulator:
             max_runtime_minutes: Maximum runtime for each evaluation
             intensive_duration_hours: Hours of intensive usage (default: 3)
             rest_duration_minutes: Minutes of rest period (default: 10)
+            in_process: Import the evaluator once and call its main() instead
+                of starting a new interpreter for every evaluation
         """
         self.evaluation_script = evaluation_script
         self.log_file = log_file
+        self._abs_log_file = os.path.abspath(log_file)
         self.max_runtime_minutes = max_runtime_minutes
         self.intensive_duration = timedelta(hours=intensive_duration_hours)
         self.rest_duration = timedelta(minutes=rest_duration_minutes)
         self.running = True
+        self._stop_event = threading.Event()
         self.execution_count = 0
         self.cycle_count = 0
         self.current_phase = "intensive"  # "intensive" or "rest"
         self.phase_start_time = None
         self.simulation_start_time = datetime.now()
         self.total_days = 4  # Number of days to run the simulation
-        self.setup_logging()
+        self.in_process = in_process
+        self._cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self._argv = (sys.executable, self.evaluation_script)
+        self._evaluator = None
+        self._process = None
+        self._next_active = None  # Start of the next active window while inactive
+        # Self-pipe that wakes _wait() on signals and stop requests
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._timer_fd = create_timerfd()
+        if self._timer_fd is not None:
+            self._selector.register(self._timer_fd, selectors.EVENT_READ)
         
-        # Create automation directory if it doesn't exist
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        # Create the log directory before the file handler opens the log
+        log_dir = os.path.dirname(self._abs_log_file)
+        if log_dir not in RealWorldSimulator._dirs_created:
+            os.makedirs(log_dir, exist_ok=True)
+            RealWorldSimulator._dirs_created.add(log_dir)
+        self.setup_logging()
+        if in_process:
+            self._evaluator = self._load_evaluator()
         
     def setup_logging(self):
         """Set up logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler(sys.stdout)
+        self._log_listener = None
+        root = logging.getLogger()
+        if not root.handlers:
+            # Records are queued and written by a background listener thread
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            handlers = [
+                RotatingFileHandler(self.log_file, maxBytes=LOG_MAX_BYTES,
+                                    backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
             ]
-        )
+            # Headless runs (systemd, nohup, pipes) already have the log file
+            if sys.stdout.isatty():
+                handlers.append(logging.StreamHandler(sys.stdout))
+            for handler in handlers:
+                handler.setFormatter(formatter)
+            log_queue = queue.SimpleQueue()
+            self._log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self._log_listener.start()
+            root.setLevel(logging.INFO)
+            root.addHandler(QueueHandler(log_queue))
         self.logger = logging.getLogger(__name__)
-        
+
+    def stop_logging(self):
+        """Flush queued log records and stop the listener thread"""
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+
+    def _load_evaluator(self):
+        """Import the evaluation script once as a module"""
+        path = os.path.join(self._cwd, self.evaluation_script)
+        spec = importlib.util.spec_from_file_location("batch_evaluator", path)
+        module = importlib.util.module_from_spec(spec)
+        with working_directory(self._cwd):
+            spec.loader.exec_module(module)
+        return module
+
+    def _call_evaluator(self):
+        """
+        Run the imported evaluator's main() with captured output.
+
+        The working directory and sys.stdout/stderr are process-wide, so this
+        must run on the main thread while nothing else is working.
+        """
+        # A text-mode spool; wrapping a binary one in TextIOWrapper needs 3.11
+        output = tempfile.SpooledTemporaryFile(max_size=OUTPUT_SPOOL_BYTES, mode='w+',
+                                               encoding='utf-8', errors='replace')
+        try:
+            with working_directory(self._cwd), \
+                    redirect_stdout(output), redirect_stderr(output):
+                try:
+                    returncode = self._evaluator.main() or 0
+                except SystemExit as e:
+                    returncode = e.code if isinstance(e.code, int) else 1
+                except Exception:
+                    traceback.print_exc()
+                    returncode = 1
+        except BaseException:
+            output.close()
+            raise
+        output.seek(0)
+        return returncode, output
+
+    def _scan_output(self, lines):
+        """Keep the key lines and a short tail of evaluator output (bytes or str lines)"""
+        key_lines = []
+        recent_output = deque(maxlen=OUTPUT_TAIL_LINES)
+        for line in lines:
+            if isinstance(line, str):
+                line = line.rstrip('\n')
+                recent_output.append(line)
+                if KEY_OUTPUT_TEXT_RE.search(line):
+                    key_lines.append(line)
+                continue
+            line = line.rstrip(b'\n')
+            recent_output.append(line)
+            if KEY_OUTPUT_RE.search(line):
+                key_lines.append(line.decode('utf-8', 'replace'))
+        return key_lines, recent_output
+
+    def _run_in_process(self, timeout):
+        """Run the evaluator on the main thread, mirroring a child process"""
+        def on_alarm(signum, frame):
+            raise EvaluationTimeout()
+        # SIGALRM interrupts main() at the deadline; without it there is no limit
+        has_alarm = hasattr(signal, "SIGALRM")
+        if has_alarm:
+            previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            returncode, output = self._call_evaluator()
+        except EvaluationTimeout:
+            raise subprocess.TimeoutExpired(self.evaluation_script, timeout)
+        finally:
+            if has_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM, previous_handler)
+        with output:
+            return (returncode, *self._scan_output(output))
+
+    def _run_subprocess(self, timeout):
+        """Run the evaluator as a child process, streaming its output"""
+        process = subprocess.Popen(
+            self._argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=self._cwd
+        )
+        self._process = process
+
+        timed_out = threading.Event()
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.start()
+
+        try:
+            key_lines, recent_output = self._scan_output(process.stdout)
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+            process.stdout.close()
+            self._process = None
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(self._argv, timeout)
+        return returncode, key_lines, recent_output
+
     def run_batch_evaluation(self):
         """Run a single batch evaluation"""
         self.execution_count += 1
@@ -82,78 +308,94 @@ class RealWorldSimulator:
         
         try:
             # Run the batch evaluator
-            result = subprocess.run([
-                sys.executable, self.evaluation_script
-            ], 
-            capture_output=True, 
-            text=True, 
-            timeout=self.max_runtime_minutes * 60,
-            cwd=os.path.dirname(os.path.dirname(__file__))
-            )
+            timeout_seconds = self.max_runtime_minutes * 60
+            if self.in_process:
+                returncode, key_lines, recent_output = self._run_in_process(timeout_seconds)
+            else:
+                returncode, key_lines, recent_output = self._run_subprocess(timeout_seconds)
             
             end_time = datetime.now()
             duration = end_time - start_time
             
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info(f"✅ Evaluation #{self.execution_count} completed successfully")
                 self.logger.info(f"Duration: {duration}")
                 
                 # Log key output lines
-                output_lines = result.stdout.split('\n')
-                for line in output_lines:
-                    if any(keyword in line for keyword in ['Uploaded', 'records saved', 'Success:', 'Error']):
-                        self.logger.info(f"   {line}")
+                for line in key_lines:
+                    self.logger.info(f"   {line}")
                         
+            elif not self.running:
+                self.logger.warning(f"⚠️ Evaluation #{self.execution_count} interrupted by shutdown")
             else:
+                output_tail = '\n'.join(
+                    line if isinstance(line, str) else line.decode('utf-8', 'replace')
+                    for line in recent_output)
                 self.logger.error(f"❌ Evaluation #{self.execution_count} failed")
-                self.logger.error(f"Return code: {result.returncode}")
-                self.logger.error(f"STDERR: {result.stderr}")
+                self.logger.error(f"Return code: {returncode}")
+                self.logger.error(f"Output (last {OUTPUT_TAIL_LINES} lines): {output_tail}")
                 
         except subprocess.TimeoutExpired:
             self.logger.error(f"⏰ Evaluation #{self.execution_count} timed out after {self.max_runtime_minutes} minutes")
         except Exception as e:
             self.logger.error(f"💥 Evaluation #{self.execution_count} crashed: {str(e)}")
     
-    def should_switch_phase(self):
-        """Check if it's time to switch phases"""
-        if not self.phase_start_time:
-            return False
-            
-        elapsed = datetime.now() - self.phase_start_time
-        
-        if self.current_phase == "intensive":
-            return elapsed >= self.intensive_duration
-        else:  # rest phase
-            return elapsed >= self.rest_duration
-    
-    def switch_phase(self):
-        """Switch between intensive and rest phases"""
-        if self.current_phase == "intensive":
-            self.current_phase = "rest"
-            self.logger.info(f"🛌 [CYCLE {self.cycle_count}] Switching to REST phase for {self.rest_duration}")
-        else:
-            self.current_phase = "intensive"
-            self.cycle_count += 1
-            self.logger.info(f"⚡ [CYCLE {self.cycle_count}] Switching to INTENSIVE phase for {self.intensive_duration}")
-        
-        self.phase_start_time = datetime.now()
-    
-    def get_next_run_time(self):
-        """Calculate when the next evaluation should run"""
-        if self.current_phase == "intensive":
-            return datetime.now() + timedelta(minutes=1)  # Every minute during intensive
-        else:
-            # During rest, return when the next intensive phase starts
-            time_until_next_phase = self.rest_duration - (datetime.now() - self.phase_start_time)
-            return datetime.now() + time_until_next_phase
-    
+    def _wait(self, timeout):
+        """
+        Sleep until timeout elapses or the simulator is asked to stop.
+
+        Returns:
+            True if the simulator should stop
+        """
+        deadline = time.monotonic() + timeout
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if self._selector.select(remaining):
+                drain_fd(self._wake_r)
+        return self._stop_event.is_set()
+
+    def _wait_until(self, when):
+        """
+        Sleep until the wall-clock datetime when, or until asked to stop.
+
+        Uses a kernel timerfd where available so the wakeup tracks the wall
+        clock; otherwise falls back to a relative _wait().
+
+        Returns:
+            True if the simulator should stop
+        """
+        if self._timer_fd is None:
+            return self._wait(max(1, (when - datetime.now()).total_seconds()))
+        set_timerfd(self._timer_fd, when.timestamp())
+        try:
+            while not self._stop_event.is_set():
+                for key, _ in self._selector.select():
+                    if key.fd == self._timer_fd:
+                        return self._stop_event.is_set()
+                    drain_fd(self._wake_r)
+        finally:
+            set_timerfd(self._timer_fd, 0)
+            drain_fd(self._timer_fd)
+        return True
+
+    def _wake(self):
+        """Interrupt a pending _wait()"""
+        try:
+            os.write(self._wake_w, b'\0')
+        except BlockingIOError:
+            pass  # Pipe already holds a pending wakeup
+
     def start_simulator(self):
         """Start the real-world simulation"""
-        self.logger.info("🌍 Starting Real-World Usage Simulator...")
-        self.logger.info(f"📋 Configuration:")
-        self.logger.info(f"   Intensive phase: {self.intensive_duration} (every 1 minute)")
-        self.logger.info(f"   Rest phase: {self.rest_duration}")
-        self.logger.info(f"   Log file: {os.path.abspath(self.log_file)}")
+        self.logger.info(
+            "🌍 Starting Real-World Usage Simulator...\n"
+            "📋 Configuration:\n"
+            f"   Intensive phase: {self.intensive_duration} (every 1 minute)\n"
+            f"   Rest phase: {self.rest_duration}\n"
+            f"   Log file: {self._abs_log_file}"
+        )
         
         # Start with intensive phase
         self.current_phase = "intensive"
@@ -164,65 +406,96 @@ class RealWorldSimulator:
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
+        # Signals write to the self-pipe, so select() returns as soon as one arrives
+        previous_wakeup_fd = signal.set_wakeup_fd(self._wake_w, warn_on_full_buffer=False)
         
+        # Bind what the loop uses on every pass
+        logger = self.logger
+        wait = self._wait
+        wait_until = self._wait_until
+        run_evaluation = self.run_batch_evaluation
+        stopped = self._stop_event.is_set
+        monotonic = time.monotonic
+        simulation_end = self.simulation_start_time + timedelta(days=self.total_days)
+        
+        next_deadline = None
         try:
-            while self.running:
+            while not stopped():
                 now = datetime.now()
+                # Stop after total_days
+                if now >= simulation_end:
+                    logger.info("⏰ 4-day simulation period completed")
+                    break
                 now_time = now.time()
                 if ACTIVE_START <= now_time < ACTIVE_END:
                     # Run batch evaluation
-                    self.logger.info("⚡ Within active hours (9am-5pm), running batch evaluation...")
-                    self.run_batch_evaluation()
-                    self.logger.info("⏳ Waiting 30 seconds until next evaluation...")
-                    for i in range(30):
-                        if not self.running:
-                            break
-                        time.sleep(1)
+                    self._next_active = None
+                    logger.info("⚡ Within active hours (9am-5pm), running batch evaluation...")
+                    if next_deadline is None:
+                        next_deadline = monotonic()
+                    run_evaluation()
+                    # Schedule from the previous start so slow evaluations don't drift the period
+                    next_deadline += EVALUATION_INTERVAL_SECONDS
+                    wait_seconds = next_deadline - monotonic()
+                    if wait_seconds < 0:
+                        # Overran the interval: start again now rather than bursting to catch up
+                        next_deadline -= wait_seconds
+                        wait_seconds = 0
+                    logger.info(f"⏳ Waiting {wait_seconds:.0f} seconds until next evaluation...")
+                    if wait(wait_seconds):
+                        break
                 else:
-                    # Calculate next ACTIVE_START datetime
-                    today_active_start = now.replace(hour=ACTIVE_START.hour, minute=ACTIVE_START.minute, second=0, microsecond=0)
-                    if now_time < ACTIVE_START:
-                        next_active = today_active_start
-                    else:
-                        # After 5pm, next active is tomorrow at 9am
-                        next_active = (now + timedelta(days=1)).replace(hour=ACTIVE_START.hour, minute=ACTIVE_START.minute, second=0, microsecond=0)
+                    next_deadline = None
+                    # Calculate next ACTIVE_START datetime once per inactive window
+                    if self._next_active is None or now >= self._next_active:
+                        self._next_active = datetime.combine(now.date(), ACTIVE_START)
+                        if now_time >= ACTIVE_START:
+                            # After 5pm, next active is tomorrow at 9am
+                            self._next_active += timedelta(days=1)
                     # Subtract 5 minutes for pre-check
-                    pre_check_time = next_active - timedelta(minutes=5)
+                    pre_check_time = self._next_active - timedelta(minutes=5)
                     if now < pre_check_time:
                         sleep_seconds = (pre_check_time - now).total_seconds()
-                        self.logger.info(f"😴 Outside active hours, sleeping for {int(sleep_seconds // 60)} minutes until 5 minutes before next active window...")
-                        time.sleep(max(1, sleep_seconds))
+                        logger.info(f"😴 Outside active hours, sleeping for {int(sleep_seconds // 60)} minutes until 5 minutes before next active window...")
+                        if wait_until(pre_check_time):
+                            break
                     else:
                         # Within 5 minutes of active window, check every 1 minute
-                        self.logger.info("⏳ Within 5 minutes of active window, checking every 1 minute...")
-                        time.sleep(60)
-                # Stop after total_days
-                if (datetime.now() - self.simulation_start_time).days >= self.total_days:
-                    self.logger.info("⏰ 4-day simulation period completed")
-                    break
+                        logger.info("⏳ Within 5 minutes of active window, checking every 1 minute...")
+                        if wait(60):
+                            break
                 
         except KeyboardInterrupt:
             self.logger.info("⚠️ Received keyboard interrupt")
         finally:
+            signal.set_wakeup_fd(previous_wakeup_fd)
             self.stop_simulator()
+            self.stop_logging()
     
     def stop_simulator(self):
         """Stop the simulator"""
         self.running = False
-        self.logger.info("🛑 Real-World Simulator stopped")
-        self.logger.info(f"📊 Final Statistics:")
-        self.logger.info(f"   Total cycles: {self.cycle_count}")
-        self.logger.info(f"   Total evaluations: {self.execution_count}")
-        self.logger.info(f"   Current phase: {self.current_phase}")
+        self._stop_event.set()
+        self._wake()
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+        self.logger.info(
+            "🛑 Real-World Simulator stopped\n"
+            "📊 Final Statistics:\n"
+            f"   Total cycles: {self.cycle_count}\n"
+            f"   Total evaluations: {self.execution_count}\n"
+            f"   Current phase: {self.current_phase}"
+        )
     
     def _signal_handler(self, signum, frame):
         """Handle system signals for graceful shutdown"""
         self.logger.info(f"📡 Received signal {signum}")
         self.stop_simulator()
     
-    def get_status(self):
+    def get_status(self, now: Optional[datetime] = None):
         """Get current simulator status"""
-        phase_elapsed = datetime.now() - self.phase_start_time if self.phase_start_time else timedelta(0)
+        phase_elapsed = (now or datetime.now()) - self.phase_start_time if self.phase_start_time else timedelta(0)
         
         if self.current_phase == "intensive":
             phase_remaining = self.intensive_duration - phase_elapsed
@@ -253,6 +526,8 @@ def main():
                        help="Maximum runtime per evaluation (minutes)")
     parser.add_argument("--test", action="store_true", 
                        help="Test mode: 30 seconds intensive, 10 seconds rest")
+    parser.add_argument("--in-process", action="store_true",
+                       help="Import the batch evaluator once instead of spawning a process per evaluation")
     
     args = parser.parse_args()
     
@@ -262,14 +537,16 @@ def main():
         simulator = RealWorldSimulator(
             intensive_duration_hours=30/3600,  # 30 seconds
             rest_duration_minutes=10/60,       # 10 seconds
-            max_runtime_minutes=args.max_runtime
+            max_runtime_minutes=args.max_runtime,
+            in_process=args.in_process
         )
     else:
         # Normal mode
         simulator = RealWorldSimulator(
             intensive_duration_hours=args.intensive_hours,
             rest_duration_minutes=args.rest_minutes,
-            max_runtime_minutes=args.max_runtime
+            max_runtime_minutes=args.max_runtime,
+            in_process=args.in_process
         )
     
     # Start the simulator
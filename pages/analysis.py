@@ -1,8 +1,6 @@
 import streamlit as st
 from utils.auth import enforce_page_access
 
-st.set_page_config(page_title="Analysis Hub", layout="wide")
-
 # ---- ACCESS CONTROL ----
 if not enforce_page_access("Analysis Hub", required_role="admin"):
     st.stop()
@@ -18,13 +18,6 @@ from email.mime.text import MIMEText
 # Remove the debug print for secrets
 # st.write("Available secrets:", list(st.secrets.keys()))
 
-# Page configuration
-st.set_page_config(
-    page_title="Blind Evaluation - LLM Comparison",
-    page_icon="🔍",
-    layout="wide"
-)
-
 # No automatic redirect - let users see completion confirmation
 
 def load_evaluation_data() -> Tuple[Dict, List[Dict]]:
@@ -944,9 +937,9 @@ def show_final_thank_you():
             for key in keys_to_clear:
                 if key in st.session_state:
                     del st.session_state[key]
-            # Explicitly set page to Home to override default navigation logic
-            st.session_state["current_page"] = "Home"
-            st.switch_page("app.py")
+            # Ask the app navigation to route back to the Home page
+            st.session_state["return_home"] = True
+            st.rerun()
 
 def show_completion_message():
     """Show completion message and collect final feedback when all evaluations are done."""
@@ -15,8 +15,6 @@ import json
 import matplotlib.pyplot as plt
 from wordcloud import WordCloud
 
-st.set_page_config(page_title="Blind Evaluation Analysis", layout="wide")
-
 # ---- ACCESS CONTROL ----
 if not enforce_page_access("Blind Evaluation Analysis", required_role="admin"):
     st.stop()
@@ -7,7 +7,6 @@ from utils.llm_clients import get_llm_client
 if not enforce_page_access("LLM Health Check", required_role="admin"):
     st.stop()
 
-st.set_page_config(page_title="LLM Health Check", layout="wide")
 st.title("🤖 LLM Health Check Dashboard")
 
 LLMS = [
@@ -18,8 +18,6 @@ import time
 import json
 from io import StringIO
 
-st.set_page_config(page_title="Provider Comparison Analysis", layout="wide")
-
 # ---- ACCESS CONTROL ----
 if not enforce_page_access("Provider Comparison Analysis", required_role="admin"):
     st.stop()
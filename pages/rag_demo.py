@@ -7,13 +7,6 @@ import os
 import pandas as pd
 import tempfile
 
-# Page configuration
-st.set_page_config(
-    page_title="RAG LLM Demo",
-    page_icon="🤖",
-    layout="wide"
-)
-
 st.title("🤖 RAG-Enhanced LLM Demo")
 st.markdown("""
 This demo illustrates how Retrieval-Augmented Generation (RAG) enhances LLM responses for business analysis.
@@ -11,8 +11,6 @@ import time
 import json
 from io import StringIO
 
-st.set_page_config(page_title="Technical Metrics Analysis", layout="wide")
-
 # ---- ACCESS CONTROL ----
 if not enforce_page_access("Technical Metrics Analysis", required_role="admin"):
     st.stop()
@@ -6,7 +6,7 @@ This script checks if data is being saved to GCS and verifies the data collectio
 
 import streamlit as st
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 
 def check_gcs_data():
     """Check if data is being saved to GCS."""
@@ -34,12 +34,13 @@ def check_gcs_data():
         # Test saving sample data
         st.write("**3. Testing data save...**")
         
+        timestamp = datetime.now(timezone.utc).isoformat()
         sample_registration = {
             "name": "GCS Test User",
             "email": "gcs-test@example.com",
             "consent_given": True,
-            "consent_timestamp": datetime.utcnow().isoformat(),
-            "registration_timestamp": datetime.utcnow().isoformat(),
+            "consent_timestamp": timestamp,
+            "registration_timestamp": timestamp,
             "evaluation_completed": False,
             "session_id": "tester"
         }
@@ -56,7 +57,7 @@ def check_gcs_data():
         sample_evaluation = {
             "tester_email": "gcs-test@example.com",
             "tester_name": "GCS Test User",
-            "evaluation_timestamp": datetime.utcnow().isoformat(),
+            "evaluation_timestamp": timestamp,
             "current_question": "Test question for GCS",
             "current_industry": "retail",
             "question_key": "retail:test_question",
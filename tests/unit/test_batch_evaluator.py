@@ -0,0 +1,242 @@
+"""
+Unit tests for the batch evaluator's storage, sampling, and throttling helpers.
+
+Tests JSON Lines migration, incremental CSV appends, indexed question
+sampling, the per-provider request rate limiter, and Retry-After handling.
+"""
+
+import unittest
+import tempfile
+import os
+import sys
+import csv
+import json
+import random
+from unittest.mock import patch
+
+import requests
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from automation.batch_evaluator import (
+    migrate_legacy_json,
+    save_csv,
+    sample_questions,
+    RequestRateLimiter,
+    classify_error,
+    http_status_of,
+    retry_delay,
+)
+from utils.llm_clients import BaseLLMClient
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Base class providing a temporary data directory."""
+
+    def setUp(self):
+        """Set up a temporary data directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up the temporary data directory."""
+        self.temp_dir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+
+class TestMigrateLegacyJson(TempDirTestCase):
+    """Test cases for converting the legacy JSON array to JSON Lines."""
+
+    def test_converts_array_to_lines(self):
+        """Test that every legacy record becomes one JSON line, in order."""
+        records = [{"batch_id": 1, "success": True}, {"batch_id": 2, "latency_sec": None}]
+        with open(self.path("metrics.json"), "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2)
+
+        migrate_legacy_json(self.path("metrics.json"), self.path("metrics.jsonl"))
+
+        with open(self.path("metrics.jsonl"), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], records)
+        self.assertTrue(os.path.exists(self.path("metrics.json")))
+
+    def test_existing_jsonl_is_left_alone(self):
+        """Test that migration only runs before the first append."""
+        with open(self.path("metrics.json"), "w", encoding="utf-8") as f:
+            json.dump([{"batch_id": 1}], f)
+        with open(self.path("metrics.jsonl"), "w", encoding="utf-8") as f:
+            f.write('{"batch_id": 7}\n')
+
+        migrate_legacy_json(self.path("metrics.json"), self.path("metrics.jsonl"))
+
+        with open(self.path("metrics.jsonl"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), '{"batch_id": 7}\n')
+
+    def test_missing_legacy_file(self):
+        """Test that nothing is created without a legacy file."""
+        migrate_legacy_json(self.path("metrics.json"), self.path("metrics.jsonl"))
+        self.assertFalse(os.path.exists(self.path("metrics.jsonl")))
+
+
+class TestSaveCsv(TempDirTestCase):
+    """Test cases for appending batch rows to the metrics CSV."""
+
+    def read_rows(self):
+        with open(self.path("metrics.csv"), newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))
+
+    def test_appends_without_repeating_header(self):
+        """Test that later batches append rows under the original header."""
+        save_csv([{"batch_id": 1, "success": True}], self.path("metrics.csv"))
+        with patch("automation.batch_evaluator.os.replace") as replace:
+            save_csv([{"batch_id": 2, "success": False}], self.path("metrics.csv"))
+
+        replace.assert_not_called()
+        self.assertEqual(self.read_rows(), [["batch_id", "success"], ["1", "True"], ["2", "False"]])
+
+    def test_header_change_rewrites_once(self):
+        """Test that new columns trigger a single rewrite, then plain appends."""
+        save_csv([{"batch_id": 1, "success": True}], self.path("metrics.csv"))
+
+        with patch("automation.batch_evaluator.os.replace", wraps=os.replace) as replace:
+            save_csv([{"batch_id": 2, "success": False, "http_status": 429}], self.path("metrics.csv"))
+            save_csv([{"batch_id": 3, "success": True, "http_status": None}], self.path("metrics.csv"))
+
+        self.assertEqual(replace.call_count, 1)
+        self.assertEqual(self.read_rows(), [
+            ["batch_id", "success", "http_status"],
+            ["1", "True", ""],
+            ["2", "False", "429"],
+            ["3", "True", ""],
+        ])
+
+    def test_empty_batch(self):
+        """Test that an empty batch does not create the file."""
+        save_csv([], self.path("metrics.csv"))
+        self.assertFalse(os.path.exists(self.path("metrics.csv")))
+
+
+class TestSampleQuestions(unittest.TestCase):
+    """Test cases for indexed question sampling."""
+
+    QUESTIONS = {
+        "retail": ["r1", "r2", "r3"],
+        "empty": [],
+        "finance": ["f1", "f2"],
+    }
+
+    def test_sample_size_and_uniqueness(self):
+        """Test that k distinct questions are drawn from the bank."""
+        bank = {(industry, q) for industry, qs in self.QUESTIONS.items() for q in qs}
+        for seed in range(20):
+            selected = sample_questions(self.QUESTIONS, 3, random.Random(seed))
+            self.assertEqual(len(selected), 3)
+            self.assertEqual(len(set(selected)), 3)
+            self.assertTrue(set(selected) <= bank)
+
+    def test_sample_larger_than_bank(self):
+        """Test that asking for more questions than exist returns them all."""
+        selected = sample_questions(self.QUESTIONS, 10, random.Random(0))
+        self.assertEqual(selected, [("retail", "r1"), ("retail", "r2"), ("retail", "r3"),
+                                    ("finance", "f1"), ("finance", "f2")])
+
+    def test_seeded_sampling_is_reproducible(self):
+        """Test that the same seed selects the same questions."""
+        first = sample_questions(self.QUESTIONS, 2, random.Random("42"))
+        second = sample_questions(self.QUESTIONS, 2, random.Random("42"))
+        self.assertEqual(first, second)
+
+    def test_empty_bank(self):
+        """Test that an empty question bank yields no questions."""
+        self.assertEqual(sample_questions({}, 5, random.Random(0)), [])
+
+
+class TestRequestRateLimiter(unittest.TestCase):
+    """Test cases for the sliding-window request limiter."""
+
+    def setUp(self):
+        """Drive the limiter from a fake clock that sleeping advances."""
+        self.now = 1000.0
+        self.sleeps = []
+
+        def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        patcher_clock = patch("automation.batch_evaluator.time.monotonic", lambda: self.now)
+        patcher_sleep = patch("automation.batch_evaluator.time.sleep", sleep)
+        patcher_clock.start()
+        patcher_sleep.start()
+        self.addCleanup(patcher_clock.stop)
+        self.addCleanup(patcher_sleep.stop)
+
+    def test_requests_within_limit_do_not_wait(self):
+        """Test that up to max_requests start immediately."""
+        limiter = RequestRateLimiter(3, window=60)
+        for _ in range(3):
+            limiter.acquire()
+        self.assertEqual(self.sleeps, [])
+
+    def test_waits_for_oldest_request_to_leave_window(self):
+        """Test that an extra request waits until the window slides."""
+        limiter = RequestRateLimiter(2, window=60)
+        limiter.acquire()
+        self.now += 20
+        limiter.acquire()
+
+        limiter.acquire()
+
+        self.assertEqual(self.sleeps, [40])
+        self.assertEqual(self.now, 1060.0)
+
+    def test_window_expiry_frees_capacity(self):
+        """Test that requests older than the window no longer count."""
+        limiter = RequestRateLimiter(1, window=60)
+        limiter.acquire()
+        self.now += 61
+
+        limiter.acquire()
+
+        self.assertEqual(self.sleeps, [])
+
+
+class TestRetryAfter(unittest.TestCase):
+    """Test cases for surfacing provider rate limits to the retry loop."""
+
+    def rate_limited(self, retry_after):
+        response = requests.Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = retry_after
+        return requests.exceptions.HTTPError("429 Client Error: Too Many Requests", response=response)
+
+    def test_client_reraises_last_http_error(self):
+        """Test that a single-attempt client passes the 429 through unchanged."""
+        error = self.rate_limited("5")
+
+        def generate():
+            raise error
+
+        with patch("utils.llm_clients.time.sleep") as sleep:
+            with self.assertRaises(requests.exceptions.HTTPError) as raised:
+                BaseLLMClient(max_retries=1)._retry_with_backoff(generate)
+
+        sleep.assert_not_called()
+        self.assertIs(raised.exception, error)
+
+    def test_429_waits_for_retry_after(self):
+        """Test that a 429 with Retry-After: 5 is classified and waits 5s."""
+        error = self.rate_limited("5")
+
+        self.assertEqual(http_status_of(error), 429)
+        self.assertEqual(classify_error(str(error)), "rate_limit")
+        self.assertEqual(retry_delay(error, 1), 5.0)
+
+    def test_retry_after_is_capped(self):
+        """Test that an excessive Retry-After is clamped to the maximum delay."""
+        self.assertEqual(retry_delay(self.rate_limited("3600"), 1), 60.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Unit tests for the real-world simulator dashboard.
+
+Tests incremental log parsing in the dashboard's LogTailer.
+"""
+
+import unittest
+import tempfile
+import os
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from automation.dashboard import LogTailer, render_frame
+
+
+class TestLogTailer(unittest.TestCase):
+    """Test cases for the LogTailer class."""
+
+    def setUp(self):
+        """Set up a temporary simulator log."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.temp_dir.name, "real_world_simulator.log")
+        self.tailer = LogTailer(self.log_file)
+
+    def tearDown(self):
+        """Clean up the temporary log."""
+        self.temp_dir.cleanup()
+
+    def append(self, text, mode='a'):
+        with open(self.log_file, mode, encoding='utf-8') as f:
+            f.write(text)
+
+    def test_missing_log(self):
+        """Test that a missing log yields no status."""
+        self.assertIsNone(self.tailer.poll())
+
+    def test_parses_phase_and_counters(self):
+        """Test phase, cycle, and evaluation counters from a log."""
+        self.append(
+            "2025-01-01 10:00:00,000 - INFO - ⚡ [CYCLE 2] Starting INTENSIVE phase for 3:00:00\n"
+            "2025-01-01 10:00:01,000 - INFO - 🚀 [CYCLE 2] Starting evaluation #1 (intensive phase)\n"
+            "2025-01-01 10:01:00,000 - INFO - ✅ Evaluation #1 completed successfully\n"
+            "2025-01-01 10:02:01,500 - INFO - 🚀 [CYCLE 2] Starting evaluation #2 (intensive phase)\n"
+            "2025-01-01 10:03:00,000 - ERROR - STDERR: evaluation failed\n"
+        )
+
+        status = self.tailer.poll()
+
+        self.assertEqual(status["current_phase"], "intensive")
+        self.assertEqual(status["cycle_count"], 2)
+        self.assertEqual(status["total_evaluations"], 2)
+        self.assertEqual(status["successful_evaluations"], 1)
+        self.assertEqual(status["failed_evaluations"], 1)
+        self.assertEqual(status["phase_start_time"], datetime(2025, 1, 1, 10, 0, 0))
+        self.assertEqual(status["last_evaluation_time"], datetime(2025, 1, 1, 10, 2, 1, 500000))
+
+    def test_reads_only_appended_lines(self):
+        """Test that counters accumulate across polls and partial lines wait."""
+        self.append("2025-01-01 10:00:01,000 - INFO - 🚀 [CYCLE 1] Starting evaluation #1 (intensive phase)\n")
+        self.assertEqual(self.tailer.poll()["total_evaluations"], 1)
+
+        self.append("2025-01-01 10:01:01,000 - INFO - 🚀 [CYCLE 1] Starting evaluation #2")
+        self.assertEqual(self.tailer.poll()["total_evaluations"], 1)
+
+        self.append(" (intensive phase)\n2025-01-01 10:05:00,000 - INFO - 🛌 [CYCLE 1] Switching to REST phase for 0:10:00\n")
+        status = self.tailer.poll()
+        self.assertEqual(status["total_evaluations"], 2)
+        self.assertEqual(status["current_phase"], "rest")
+        self.assertEqual(status["phase_start_time"], datetime(2025, 1, 1, 10, 5, 0))
+
+    def test_lines_spanning_read_blocks(self):
+        """Test that lines split across read blocks are parsed once."""
+        self.append(
+            "2025-01-01 10:00:00,000 - INFO - ⚡ [CYCLE 3] Starting INTENSIVE phase for 3:00:00\n"
+            "2025-01-01 10:00:01,000 - INFO - 🚀 [CYCLE 3] Starting evaluation #1 (intensive phase)\n"
+            "2025-01-01 10:01:00,000 - INFO - ✅ Evaluation #1 completed successfully\n"
+        )
+
+        with patch('automation.dashboard.READ_BLOCK_SIZE', 7):
+            status = self.tailer.poll()
+
+        self.assertEqual(status["cycle_count"], 3)
+        self.assertEqual(status["total_evaluations"], 1)
+        self.assertEqual(status["successful_evaluations"], 1)
+
+    def test_truncated_log_resets(self):
+        """Test that a truncated log is re-read from the start."""
+        self.append(
+            "2025-01-01 10:00:01,000 - INFO - 🚀 [CYCLE 1] Starting evaluation #1 (intensive phase)\n"
+            "2025-01-01 10:01:01,000 - INFO - 🚀 [CYCLE 1] Starting evaluation #2 (intensive phase)\n"
+        )
+        self.assertEqual(self.tailer.poll()["total_evaluations"], 2)
+
+        self.append("2025-01-02 09:00:01,000 - INFO - 🚀 [CYCLE 1] Starting evaluation #1\n", mode='w')
+        self.assertEqual(self.tailer.poll()["total_evaluations"], 1)
+
+    def test_resumes_from_saved_state(self):
+        """Test that a new tailer resumes counters from the state file."""
+        state_file = os.path.join(self.temp_dir.name, "dashboard_state.json")
+        self.append(
+            "2025-01-01 10:00:00,000 - INFO - ⚡ [CYCLE 5] Starting INTENSIVE phase for 3:00:00\n"
+            "2025-01-01 10:00:01,000 - INFO - 🚀 [CYCLE 5] Starting evaluation #1 (intensive phase)\n"
+        )
+        LogTailer(self.log_file, state_file).poll()
+
+        self.append("2025-01-01 10:01:01,000 - INFO - 🚀 [CYCLE 5] Starting evaluation #2 (intensive phase)\n")
+        resumed = LogTailer(self.log_file, state_file)
+        self.assertGreater(resumed.offset, 0)
+
+        status = resumed.poll()
+        self.assertEqual(status["total_evaluations"], 2)
+        self.assertEqual(status["cycle_count"], 5)
+        self.assertEqual(status["phase_start_time"], datetime(2025, 1, 1, 10, 0, 0))
+        self.assertEqual(status["last_evaluation_time"], datetime(2025, 1, 1, 10, 1, 1))
+
+    def test_ignores_state_for_truncated_log(self):
+        """Test that saved state is discarded when the log shrank."""
+        state_file = os.path.join(self.temp_dir.name, "dashboard_state.json")
+        self.append(
+            "2025-01-01 10:00:01,000 - INFO - 🚀 [CYCLE 1] Starting evaluation #1 (intensive phase)\n"
+            "2025-01-01 10:01:01,000 - INFO - 🚀 [CYCLE 1] Starting evaluation #2 (intensive phase)\n"
+        )
+        LogTailer(self.log_file, state_file).poll()
+
+        self.append("2025-01-02 09:00:01,000 - INFO - 🚀 [CYCLE 1] Starting evaluation #1\n", mode='w')
+        self.assertEqual(LogTailer(self.log_file, state_file).poll()["total_evaluations"], 1)
+
+
+class TestRenderFrame(unittest.TestCase):
+    """Test cases for dashboard frame rendering."""
+
+    def test_not_running(self):
+        """Test the frame shown when the simulator is stopped."""
+        frame = render_frame({"running": False, "pid": None}, None, datetime(2025, 1, 1, 12, 0, 0))
+
+        self.assertIn("SIMULATOR NOT RUNNING", frame)
+        self.assertNotIn("CURRENT PHASE", frame)
+
+    def test_running_with_status(self):
+        """Test progress and statistics rendering for an intensive phase."""
+        log_status = {
+            "current_phase": "intensive",
+            "cycle_count": 4,
+            "total_evaluations": 4,
+            "successful_evaluations": 3,
+            "failed_evaluations": 1,
+            "last_evaluation_time": datetime(2025, 1, 1, 11, 59, 0),
+            "phase_start_time": datetime(2025, 1, 1, 10, 30, 0),
+        }
+
+        frame = render_frame({"running": True, "pid": "123"}, log_status, datetime(2025, 1, 1, 12, 0, 0))
+
+        self.assertIn("PID: 123", frame)
+        self.assertIn("🔄 CYCLE: 4", frame)
+        self.assertIn("50.0%", frame)
+        self.assertIn("Success Rate: 75.0%", frame)
+        self.assertIn("Last Evaluation: 0:01:00 ago", frame)
+        self.assertTrue(all(line.endswith("\x1b[K") for line in frame.splitlines()))
+
+
+if __name__ == '__main__':
+    unittest.main()
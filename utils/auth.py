@@ -153,8 +153,6 @@ def show_admin_login() -> bool:
             
             if verify_admin_access(password):
                 set_user_session("admin")
-                # Set the current page to Analysis Dashboard for admins
-                st.session_state["current_page"] = "Analysis Dashboard"
                 st.success("✅ Administrator access granted!")
                 st.rerun()
                 return True
@@ -164,10 +162,18 @@ def show_admin_login() -> bool:
     
     return False
 
-def show_logout_button():
-    """Display logout button and handle logout."""
-    current_role = get_current_user_role()
-    current_email = get_current_user_email()
+def show_logout_button(current_role: Role = None, current_email: Optional[str] = None):
+    """
+    Display logout button and handle logout.
+    
+    Args:
+        current_role: Current user role, if already looked up by the caller
+        current_email: Current user email, if already looked up by the caller
+    """
+    if current_role is None:
+        current_role = get_current_user_role()
+    if current_email is None:
+        current_email = get_current_user_email()
     
     if current_role:
         st.sidebar.markdown("---")
@@ -186,18 +192,20 @@ def show_logout_button():
             st.success("✅ Logged out successfully!")
             st.rerun()
 
-def enforce_page_access(page_name: str, required_role: Role = None) -> bool:
+def enforce_page_access(page_name: str, required_role: Role = None, current_role: Role = None) -> bool:
     """
     Enforce access control for a specific page.
     
     Args:
         page_name: Name of the page being accessed
         required_role: Role required to access the page (None for any authenticated user)
+        current_role: Current user role, if already looked up by the caller
     
     Returns:
         True if access is allowed, False otherwise
     """
-    current_role = get_current_user_role()
+    if current_role is None:
+        current_role = get_current_user_role()
     
     if not current_role:
         st.error(f"🔒 Authentication required to access {page_name}.")
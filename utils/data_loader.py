@@ -6,6 +6,12 @@ import pandas as pd
 from typing import List, Optional
 import os
 
+try:
+    import pyarrow  # noqa: F401  (enables pandas' multithreaded CSV engine)
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 def load_csv_dataset(path: str, text_column: Optional[str] = None) -> List[str]:
     """
     Load a CSV dataset and return a list of text documents.
@@ -20,11 +26,15 @@ def load_csv_dataset(path: str, text_column: Optional[str] = None) -> List[str]:
     """
     if not os.path.exists(path):
         raise FileNotFoundError(f"CSV file not found: {path}")
-    df = pd.read_csv(path)
+    # Read the header first so only the text column is parsed
+    columns = pd.read_csv(path, nrows=0).columns
     if text_column is None:
-        text_column = df.columns[0]
-    if text_column not in df.columns:
+        text_column = columns[0]
+    if text_column not in columns:
         raise ValueError(f"Column '{text_column}' not found in CSV.")
+    # Cells are kept as their raw text; engines differ in type inference
+    # (pyarrow turns dates into timestamps), which would change the chunks
+    df = pd.read_csv(path, usecols=[text_column], dtype=str, engine=CSV_ENGINE)
     docs = df[text_column].dropna().astype(str).tolist()
     return docs
 
@@ -525,11 +525,11 @@ class DataStore:
             if self.storage_type == "gcs" and self.storage_client:
                 bucket = self.storage_client.bucket(self.bucket_name)
                 
-                # Try to load JSON first
-                json_blob = bucket.blob("batch_eval_metrics.json")
+                # Try to load JSON Lines first
+                json_blob = bucket.blob("batch_eval_metrics.jsonl")
                 if json_blob.exists():
                     json_content = json_blob.download_as_text()
-                    return json.loads(json_content)
+                    return [json.loads(line) for line in json_content.splitlines() if line]
                 
                 # Fallback to CSV if JSON not available
                 csv_blob = bucket.blob("batch_eval_metrics.csv")
@@ -539,11 +539,11 @@ class DataStore:
                     return df.to_dict('records')
                 
             elif self.storage_type == "local":
-                # Try local JSON first
-                json_path = os.path.join("data", "batch_eval_metrics.json")
+                # Try local JSON Lines first
+                json_path = os.path.join("data", "batch_eval_metrics.jsonl")
                 if os.path.exists(json_path):
                     with open(json_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+                        return [json.loads(line) for line in f if line.strip()]
                 
                 # Fallback to local CSV
                 csv_path = os.path.join("data", "batch_eval_metrics.csv")
@@ -2,32 +2,46 @@
 embedding.py
 Module for generating vector embeddings for text chunks.
 """
+import threading
+from functools import lru_cache
 from typing import List
 from sentence_transformers import SentenceTransformer
-import streamlit as st
+
+# Serializes the first load so concurrent callers share one model
+_model_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _load_embedding_model(model_name: str):
+    return SentenceTransformer(model_name)
 
 def get_embedding_model(model_name: str = "all-MiniLM-L6-v2"):
     """
-    Load and return the embedding model (with Streamlit caching).
+    Load and return the embedding model (cached for the process, thread-safe).
     Args:
         model_name: Name of the embedding model
     Returns:
         Embedding model object
     """
-    @st.cache_resource(show_spinner=False)
-    def load_model(name):
-        return SentenceTransformer(name)
-    return load_model(model_name)
+    with _model_lock:
+        return _load_embedding_model(model_name)
 
-def embed_texts(texts: List[str], model) -> List[list]:
+def embed_texts(texts: List[str], model, batch_size: int = 32, normalize_embeddings: bool = False) -> List[list]:
     """
     Generate embeddings for a list of texts.
     Args:
         texts: List of text strings
         model: Embedding model object
+        batch_size: Number of texts encoded per forward pass
+        normalize_embeddings: Return unit-length vectors so similarity is a dot product
     Returns:
         List of embedding vectors
     """
     if not texts:
         return []
-    return model.encode(texts, show_progress_bar=False, convert_to_numpy=True).tolist() 
\ No newline at end of file
+    return model.encode(
+        texts,
+        batch_size=batch_size,
+        show_progress_bar=False,
+        convert_to_numpy=True,
+        normalize_embeddings=normalize_embeddings,
+    ).tolist() 
\ No newline at end of file
@@ -5,10 +5,15 @@ API clients for Groq, Google Gemini, and OpenRouter (free-tier LLMs).
 from typing import Optional, Dict
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import time
 import random
 
+# Connection pool sizing for each client's HTTP session
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 16
+
 def get_secret_or_env(key: str, env_key: str) -> str:
     # Try Streamlit secrets, then environment variable
     try:
@@ -25,6 +30,9 @@ class BaseLLMClient:
     def __init__(self, max_retries: int = 3, base_delay: float = 1.0):
         self.max_retries = max_retries
         self.base_delay = base_delay
+        # One session per client so retries and later calls reuse TCP/TLS connections
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE))
     
     def _retry_with_backoff(self, func, *args, **kwargs):
         """Retry function with exponential backoff."""
@@ -32,6 +40,8 @@ class BaseLLMClient:
             try:
                 return func(*args, **kwargs)
             except requests.exceptions.HTTPError as e:
+                if attempt == self.max_retries - 1:
+                    raise  # Keep the status and Retry-After for the caller
                 if e.response.status_code == 429:  # Rate limit
                     delay = self.base_delay * (2 ** attempt) + random.uniform(0, 1)
                     print(f"Rate limited, waiting {delay:.2f}s before retry {attempt + 1}")
@@ -78,7 +88,7 @@ class GroqClient(BaseLLMClient):
         }
         
         def _make_request():
-            resp = requests.post(self.endpoint, headers=headers, json=data, timeout=60)
+            resp = self.session.post(self.endpoint, headers=headers, json=data, timeout=60)
             resp.raise_for_status()
             result = resp.json()
             return result["choices"][0]["message"]["content"].strip()
@@ -106,7 +116,7 @@ class GeminiClient(BaseLLMClient):
         }
         
         def _make_request():
-            resp = requests.post(self.endpoint, headers=headers, json=data, timeout=60)
+            resp = self.session.post(self.endpoint, headers=headers, json=data, timeout=60)
             resp.raise_for_status()
             result = resp.json()
             return result["candidates"][0]["content"]["parts"][0]["text"].strip()
@@ -140,7 +150,7 @@ class OpenRouterClient(BaseLLMClient):
         }
         
         def _make_request():
-            resp = requests.post(self.endpoint, headers=headers, json=data, timeout=60)
+            resp = self.session.post(self.endpoint, headers=headers, json=data, timeout=60)
             resp.raise_for_status()
             result = resp.json()
             return result["choices"][0]["message"]["content"].strip()
@@ -149,20 +159,26 @@ class OpenRouterClient(BaseLLMClient):
 
 # Utility function to select and instantiate a client by provider/model
 
-def get_llm_client(provider: str, model: str = None) -> object:
+def get_llm_client(provider: str, model: str = None, max_retries: Optional[int] = None) -> object:
     """
     Factory to get the correct LLM client for a provider.
     Args:
         provider: 'groq', 'gemini', or 'openrouter'
         model: Optional model name
+        max_retries: Optional attempt count, overriding the client's default
     Returns:
         LLM client instance
     """
+    kwargs = {}
+    if model:
+        kwargs["model"] = model
+    if max_retries is not None:
+        kwargs["max_retries"] = max_retries
     if provider == "groq":
-        return GroqClient(model=model) if model else GroqClient()
+        return GroqClient(**kwargs)
     elif provider == "gemini":
-        return GeminiClient(model=model) if model else GeminiClient()
+        return GeminiClient(**kwargs)
     elif provider == "openrouter":
-        return OpenRouterClient(model=model) if model else OpenRouterClient()
+        return OpenRouterClient(**kwargs)
     else:
         raise ValueError(f"Unknown LLM provider: {provider}") 
\ No newline at end of file
@@ -5,6 +5,7 @@ Script to pregenerate LLM responses for all evaluation questions using the RAG p
 import json
 from typing import List, Dict
 from utils.rag_pipeline import build_rag_index, retrieve_context
+from utils.embedding import get_embedding_model
 from utils.llm_clients import get_llm_client
 from utils.prompts import build_prompt
 import os
@@ -259,9 +260,10 @@ def main():
         {"provider": "openrouter", "model": "deepseek/deepseek-r1-0528-qwen3-8b"}
     ]
     
-    # Build separate RAG indices for each industry with distinct persistence paths
+    # Build separate RAG indices for each industry with distinct persistence paths,
+    # all embedded with one model
     rag_indices = {}
-    embedding_models = {}
+    embedding_model = get_embedding_model()
     rag_index_paths = {
         "retail": "data/shopping_trends_with_rag.csv",
         "finance": "data/Tesla_stock_data_with_rag.csv"
@@ -275,17 +277,15 @@ def main():
             dataset_path, 
             dataset_type="csv", 
             text_column="RAG_Text",
-            persist_path=persist_path
+            persist_path=persist_path,
+            model=embedding_model
         )
-        from utils.embedding import get_embedding_model
-        embedding_models[industry] = get_embedding_model()
     
     # For each industry and question, run RAG and call each LLM
     all_results = []
     
     for industry, qs in questions.items():
         rag_index = rag_indices[industry]
-        embedding_model = embedding_models[industry]
         
         # Select the right dataframe and summary function
         if industry == 'retail':
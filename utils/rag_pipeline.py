@@ -9,7 +9,7 @@ from utils.embedding import get_embedding_model, embed_texts
 from utils.vector_db import VectorDB
 import pandas as pd
 
-def build_rag_index(dataset_path: str, dataset_type: str = "csv", text_column: str = None, chunk_size: int = 500, overlap: int = 50, persist_path: str = None) -> VectorDB:
+def build_rag_index(dataset_path: str, dataset_type: str = "csv", text_column: str = None, chunk_size: int = 500, overlap: int = 50, persist_path: str = None, model: Any = None) -> VectorDB:
     """
     Build the RAG index from a dataset (CSV or text).
     Args:
@@ -19,6 +19,7 @@ def build_rag_index(dataset_path: str, dataset_type: str = "csv", text_column: s
         chunk_size: Chunk size for splitting text
         overlap: Overlap between chunks
         persist_path: Optional path for vector DB persistence
+        model: Optional embedding model; the shared default is loaded if omitted
     Returns:
         VectorDB object with indexed data
     """
@@ -37,7 +38,8 @@ def build_rag_index(dataset_path: str, dataset_type: str = "csv", text_column: s
     chunks = chunk_documents(docs, chunk_size=chunk_size, overlap=overlap)
     print(f"Chunked into {len(chunks)} chunks.")
     # Get embedding model
-    model = get_embedding_model()
+    if model is None:
+        model = get_embedding_model()
     # Embed chunks
     embeddings = embed_texts(chunks, model)
     print(f"Preparing metadatas for {len(chunks)} chunks.")
@@ -82,4 +84,35 @@ def retrieve_context(query: str, vector_db: VectorDB, embedding_model: Any, top_
     print(f"Retrieved {len(results)} context chunks.")
     if results:
         print(f"First retrieved chunk text: {results[0].get('text', 'N/A')[:100]}...")
+    return results
+
+def retrieve_contexts(queries: List[str], vector_db: VectorDB, embedding_model: Any, top_k: int = 5) -> List[List[Dict]]:
+    """
+    Retrieve context chunks for several queries against the same index.
+    Embeds all queries in one batch and issues a single vector DB query.
+    Args:
+        queries: Query strings
+        vector_db: VectorDB object
+        embedding_model: Embedding model object
+        top_k: Number of chunks to retrieve per query
+    Returns:
+        List of metadata dict lists, one per query in input order
+    """
+    if not queries:
+        return []
+    print(f"Querying for context: {len(queries)} queries")
+    return retrieve_contexts_with_embeddings(embed_texts(queries, embedding_model), vector_db, top_k=top_k)
+
+def retrieve_contexts_with_embeddings(query_embeddings: List[list], vector_db: VectorDB, top_k: int = 5) -> List[List[Dict]]:
+    """
+    Retrieve context chunks for queries that were already embedded.
+    Args:
+        query_embeddings: Embedding vectors for the queries
+        vector_db: VectorDB object
+        top_k: Number of chunks to retrieve per query
+    Returns:
+        List of metadata dict lists, one per embedding in input order
+    """
+    results = vector_db.query_many(query_embeddings, top_k=top_k)
+    print(f"Retrieved {sum(len(r) for r in results)} context chunks.")
     return results 
\ No newline at end of file
@@ -13,11 +13,15 @@ import re
 import json
 import hashlib
 from datetime import datetime, timezone
-from typing import Dict, Optional, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List, Tuple
 import logging
 import os
 REGISTRATION_FILE = os.path.join('data', 'registrations.json')
 
+# Shared read-only fallback for sessions without registration data
+_EMPTY_REGISTRATIONS: Mapping[str, Dict] = MappingProxyType({})
+
 # Email validation regex pattern
 EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
@@ -101,6 +105,59 @@ def get_registration_storage_key() -> str:
     """
     return "tester_registrations"
 
+def get_session_registrations() -> Mapping[str, Dict]:
+    """
+    Get the registration data stored in the current session.
+    
+    Returns:
+        Mapping of email to registration record (read-only when empty)
+    """
+    return st.session_state.get(get_registration_storage_key()) or _EMPTY_REGISTRATIONS
+
+def get_app_cache() -> Dict:
+    """
+    Get the per-session dict holding app bookkeeping values.
+    
+    Keeping these under a single session state key turns repeated
+    session state probes into plain dict access.
+    
+    Returns:
+        Mutable bookkeeping dict for the current session
+    """
+    return st.session_state.setdefault("_app_cache", {"registrations_version": 0})
+
+def get_registrations_version() -> int:
+    """
+    Get the version counter of the session registration data.
+    
+    Returns:
+        Number of changes made to the session registration data
+    """
+    return get_app_cache()["registrations_version"]
+
+def bump_registrations_version():
+    """Mark the session registration data as changed so cached views are rebuilt."""
+    get_app_cache()["registrations_version"] += 1
+
+def get_registration_rows() -> Tuple[Tuple, ...]:
+    """
+    Get a hashable snapshot of the session registration data.
+    
+    Returns:
+        Tuple of (name, email, consent_given, registration_timestamp, evaluation_completed) rows
+    """
+    registrations = get_session_registrations()
+    return tuple(
+        (
+            reg.get("name", "N/A"),
+            email,
+            reg.get("consent_given", False),
+            reg.get("registration_timestamp", ""),
+            reg.get("evaluation_completed", False)
+        )
+        for email, reg in registrations.items()
+    )
+
 def load_registrations_from_file() -> Dict[str, Dict]:
     """Load registrations from data store."""
     try:
@@ -151,13 +208,8 @@ def get_registered_emails() -> List[str]:
     """
     Get list of already registered email addresses from both session and file.
     """
-    storage_key = get_registration_storage_key()
-    
     # Get emails from session state
-    if storage_key not in st.session_state:
-        st.session_state[storage_key] = {}
-    
-    session_emails = [email.lower() for email in st.session_state[storage_key].keys()]
+    session_emails = [email.lower() for email in get_session_registrations()]
     
     # Get emails from file
     file_regs = load_registrations_from_file()
@@ -181,6 +233,7 @@ def store_registration(registration_record: Dict) -> bool:
         
         # Store in session state
         st.session_state[storage_key][email] = registration_record
+        bump_registrations_version()
         
         # Also update file
         regs = load_registrations_from_file()
@@ -231,11 +284,9 @@ def has_email_completed_evaluation(email: str) -> bool:
     email_normalized = email.strip().lower()
     
     # Check session state
-    storage_key = get_registration_storage_key()
-    if storage_key in st.session_state:
-        session_reg = st.session_state[storage_key].get(email_normalized)
-        if session_reg and session_reg.get("evaluation_completed", False):
-            return True
+    session_reg = get_session_registrations().get(email_normalized)
+    if session_reg and session_reg.get("evaluation_completed", False):
+        return True
     
     # Check file storage
     file_regs = load_registrations_from_file()
@@ -326,13 +377,11 @@ def get_registration_by_email(email: str) -> Optional[Dict]:
         return None
     
     email_normalized = email.strip().lower()
-    storage_key = get_registration_storage_key()
     
     # Check session state first
-    if storage_key in st.session_state:
-        registrations = st.session_state[storage_key]
-        if email_normalized in registrations:
-            return registrations[email_normalized]
+    registrations = get_session_registrations()
+    if email_normalized in registrations:
+        return registrations[email_normalized]
     
     # Check file storage
     file_regs = load_registrations_from_file()
@@ -341,33 +390,26 @@ def get_registration_by_email(email: str) -> Optional[Dict]:
     
     return None
 
+@st.cache_data(show_spinner=False)
+def _compute_registration_stats(version: int, rows: Tuple[Tuple, ...]) -> Dict:
+    """Aggregate registration statistics for a registration snapshot."""
+    return {
+        "total_registrations": len(rows),
+        "consented_registrations": sum(1 for row in rows if row[2]),
+        "completed_evaluations": sum(1 for row in rows if row[4])
+    }
+
 def get_registration_stats() -> Dict:
     """
     Get statistics about registrations.
     
+    Results are cached per registration snapshot, so reruns that do not
+    change the registration data skip the aggregation.
+    
     Returns:
         Dictionary with registration statistics
     """
-    storage_key = get_registration_storage_key()
-    
-    if storage_key not in st.session_state:
-        return {
-            "total_registrations": 0,
-            "consented_registrations": 0,
-            "completed_evaluations": 0
-        }
-    
-    registrations = st.session_state[storage_key]
-    
-    total = len(registrations)
-    consented = sum(1 for reg in registrations.values() if reg.get("consent_given", False))
-    completed = sum(1 for reg in registrations.values() if reg.get("evaluation_completed", False))
-    
-    return {
-        "total_registrations": total,
-        "consented_registrations": consented,
-        "completed_evaluations": completed
-    }
+    return _compute_registration_stats(get_registrations_version(), get_registration_rows())
 
 def show_registration_form() -> Tuple[bool, Optional[Dict]]:
     """
@@ -12,19 +12,23 @@ class VectorDB:
     """
     Abstracts vector database operations for RAG using ChromaDB (client-only mode).
     """
-    def __init__(self, collection_name: str = "rag_collection", persist_path: str = None):
+    def __init__(self, collection_name: str = "rag_collection", persist_path: str = None, metric: str = "l2"):
         """
         Initialize the vector database (in-memory only; persistence is disabled to avoid tenant errors).
         Args:
             collection_name: Name of the collection to use (default: 'rag_collection')
             persist_path: (Ignored) Optional path for persistence
+            metric: HNSW distance, 'l2', 'cosine' or 'ip' (inner product; use
+                with unit-length embeddings to skip the cosine normalization)
         """
         self.persist_path = None  # Force in-memory
         self.collection_name = collection_name
         # Always use in-memory mode to avoid tenant/persistence errors
         self.client = chromadb.Client(Settings(is_persistent=False))
         # Use get_or_create_collection for safety
-        self.collection = self.client.get_or_create_collection(self.collection_name)
+        self.collection = self.client.get_or_create_collection(
+            self.collection_name, metadata={"hnsw:space": metric}
+        )
 
     def add_documents(self, embeddings: List[list], metadatas: List[dict]):
         """
@@ -56,6 +60,23 @@ class VectorDB:
         # Return metadata for top results
         return [meta for meta in results["metadatas"][0]]
 
+    def query_many(self, query_embeddings: List[list], top_k: int = 5) -> List[List[Dict]]:
+        """
+        Query the vector DB for several embeddings in one request.
+        Args:
+            query_embeddings: Embedding vectors for the queries
+            top_k: Number of top results to return per query
+        Returns:
+            List of metadata dict lists, one per query in input order
+        """
+        if not query_embeddings:
+            return []
+        results = self.collection.query(
+            query_embeddings=query_embeddings,
+            n_results=top_k
+        )
+        return [list(metas) for metas in results["metadatas"]]
+
     def num_documents(self) -> int:
         """
         Return the number of documents in the collection.